@@ -0,0 +1,171 @@
+import os
+
+# Todo lo que str.splitlines() considera salto de línea; la lectura en modo
+# texto corta al menos en '\n' y '\r', así que ninguno puede ir en un elemento.
+SALTOS_DE_LINEA = frozenset('\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029')
+
+
+class AlmacenConjunto:
+    """Conjunto de strings persistido en disco con un log de operaciones.
+
+    El estado se guarda en dos archivos:
+        - ``<ruta>.snap``: una foto del conjunto, un elemento por línea.
+        - ``<ruta>.log``: operaciones posteriores a la foto, una por línea
+          (``+elemento`` para agregar, ``-elemento`` para eliminar).
+
+    Agregar o eliminar solo escribe una línea al final del log, así que cada
+    operación es O(1). Cuando el log crece más que el conjunto se compacta:
+    se reescribe la foto y se vacía el log.
+
+    Attributes:
+        ruta (str): Ruta base de los archivos, sin extensión.
+        elementos (set[str]): Conjunto en memoria.
+    """
+
+    def __init__(self, ruta: str, umbral_compactacion: int = 100_000) -> None:
+        """Abre (o crea) el almacén y carga su contenido.
+
+        Args:
+            ruta (str): Ruta base de los archivos, sin extensión.
+            umbral_compactacion (int): Cantidad mínima de operaciones en el log
+                antes de considerar una compactación automática.
+        """
+        self.ruta = ruta
+        self.umbral_compactacion = umbral_compactacion
+        self.elementos = set()
+        self._operaciones_en_log = 0
+        self._cargar()
+        self._log = open(self._ruta_log, 'a', encoding='utf-8')
+
+    @property
+    def _ruta_snap(self) -> str:
+        return self.ruta + ".snap"
+
+    @property
+    def _ruta_log(self) -> str:
+        return self.ruta + ".log"
+
+    def _cargar(self) -> None:
+        if os.path.exists(self._ruta_snap):
+            with open(self._ruta_snap, 'r', encoding='utf-8') as archivo:
+                self.elementos = {linea.rstrip('\n') for linea in archivo}
+        if os.path.exists(self._ruta_log):
+            with open(self._ruta_log, 'rb') as archivo:
+                contenido = archivo.read()
+            # una última línea sin '\n' es una escritura cortada por una caída:
+            # se descarta y se corta el archivo, si no la próxima operación se pegaría a ella
+            completo = contenido.rfind(b'\n') + 1
+            if completo < len(contenido):
+                with open(self._ruta_log, 'r+b') as archivo:
+                    archivo.truncate(completo)
+                    archivo.flush()
+                    os.fsync(archivo.fileno())
+            for linea in contenido[:completo].decode('utf-8').splitlines():
+                operacion, elemento = linea[:1], linea[1:]
+                if operacion == '+':
+                    self.elementos.add(elemento)
+                elif operacion == '-':
+                    self.elementos.discard(elemento)
+                self._operaciones_en_log += 1
+
+    def agregar(self, elemento: str) -> bool:
+        """Agrega un elemento al conjunto.
+
+        Args:
+            elemento (str): Elemento a agregar. No puede contener saltos de línea.
+
+        Returns:
+            bool: True si el elemento era nuevo, False si ya estaba.
+
+        Raises:
+            ValueError: Si el elemento contiene un salto de línea ('\n', '\r', etc.).
+        """
+        if not SALTOS_DE_LINEA.isdisjoint(elemento):
+            raise ValueError("El elemento no puede contener saltos de línea")
+        if elemento in self.elementos:
+            return False
+        self.elementos.add(elemento)
+        self._registrar('+', elemento)
+        return True
+
+    def eliminar(self, elemento: str) -> bool:
+        """Elimina un elemento del conjunto.
+
+        Args:
+            elemento (str): Elemento a eliminar.
+
+        Returns:
+            bool: True si el elemento estaba y se eliminó, False si no estaba.
+        """
+        if elemento not in self.elementos:
+            return False
+        self.elementos.remove(elemento)
+        self._registrar('-', elemento)
+        return True
+
+    def _registrar(self, operacion: str, elemento: str) -> None:
+        self._log.write(f"{operacion}{elemento}\n")
+        self._operaciones_en_log += 1
+        if (self._operaciones_en_log >= self.umbral_compactacion
+                and self._operaciones_en_log > len(self.elementos)):
+            self.compactar()
+
+    def compactar(self) -> None:
+        """Reescribe la foto con el estado actual y vacía el log.
+
+        La foto nueva se escribe en un archivo temporal, se baja a disco con
+        fsync y recién entonces reemplaza a la anterior; el log se vacía después
+        de que el reemplazo también quedó en disco. Así un corte de luz a mitad
+        de camino deja la foto vieja con su log o la nueva, nunca ninguna.
+        """
+        self._log.close()
+        temporal = self._ruta_snap + ".tmp"
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            archivo.writelines(f"{elemento}\n" for elemento in self.elementos)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, self._ruta_snap)
+        self._sincronizar_directorio()
+        self._log = open(self._ruta_log, 'w', encoding='utf-8')
+        self._operaciones_en_log = 0
+
+    def _sincronizar_directorio(self) -> None:
+        # el rename es una escritura del directorio; sin esto podría perderse
+        if os.name != 'posix':
+            return
+        descriptor = os.open(os.path.dirname(os.path.abspath(self.ruta)), os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    def sincronizar(self) -> None:
+        """Fuerza la escritura del log a disco."""
+        self._log.flush()
+        os.fsync(self._log.fileno())
+
+    def cerrar(self) -> None:
+        """Escribe lo pendiente y cierra el log."""
+        if not self._log.closed:
+            self._log.close()
+
+    def resumen(self) -> str:
+        """Devuelve un resumen corto del conjunto sin listar todos los elementos.
+
+        Returns:
+            str: Texto con la cantidad de elementos y las operaciones pendientes de compactar.
+        """
+        return (f"{len(self.elementos)} elementos "
+                f"({self._operaciones_en_log} operaciones en el log)")
+
+    def __len__(self) -> int:
+        return len(self.elementos)
+
+    def __contains__(self, elemento: str) -> bool:
+        return elemento in self.elementos
+
+    def __enter__(self) -> 'AlmacenConjunto':
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.cerrar()
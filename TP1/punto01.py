@@ -4,7 +4,12 @@ def ordenar_lista_numeros(lista_numeros):
     return lista_ordenada
 
 
-numeros_ejemplo = [5, 2, 8, 1, 9, 3, 5, 2, 7, 4, 6, 1]
-print("Lista original:", numeros_ejemplo)
-resultado = ordenar_lista_numeros(numeros_ejemplo)
-print("Lista ordenada:", resultado)
+def main():
+    numeros_ejemplo = [5, 2, 8, 1, 9, 3, 5, 2, 7, 4, 6, 1]
+    print("Lista original:", numeros_ejemplo)
+    resultado = ordenar_lista_numeros(numeros_ejemplo)
+    print("Lista ordenada:", resultado)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,9 @@
+import sys
+from itertools import islice
+
+from TP1.almacen_conjunto import AlmacenConjunto
+
+
 def crear_conjunto():
     conjunto = set()
     print("=== CREACIÓN DE CONJUNTO ===")
@@ -8,7 +14,7 @@ def crear_conjunto():
             break
         conjunto.add(elemento)
         print(f"Elemento '{elemento}' agregado al conjunto.")
-        print(f"Conjunto actual: {conjunto}")
+        print(f"Conjunto actual: {len(conjunto)} elementos")
     
     return conjunto
 
@@ -17,7 +23,7 @@ def eliminar_elemento(conjunto):
     print("\n=== ELIMINACIÓN DE ELEMENTOS ===")
     
     while True:
-        print(f"\nConjunto actual: {conjunto}")
+        print(f"\nConjunto actual: {len(conjunto)} elementos")
         
         if not conjunto:
             print("El conjunto está vacío. No hay elementos para eliminar.")
@@ -35,6 +41,87 @@ def eliminar_elemento(conjunto):
             print(f"El elemento '{elemento}' no está presente en el conjunto.")
 
 
+def procesar_lote(lineas, almacen: AlmacenConjunto) -> dict[str, int]:
+    """Aplica al almacén una secuencia de comandos sin interacción.
+
+    Cada línea es un comando: ``agregar <elemento>``, ``eliminar <elemento>``
+    o ``compactar``. Las líneas vacías y las que empiezan con ``#`` se ignoran.
+
+    Args:
+        lineas: Iterable de líneas (un archivo abierto, sys.stdin, una lista...).
+        almacen (AlmacenConjunto): Almacén sobre el que se aplican los comandos.
+
+    Returns:
+        dict[str, int]: Cantidad de elementos agregados, eliminados, ignorados
+        (ya presentes o ausentes) y líneas inválidas.
+    """
+    resumen = {'agregados': 0, 'eliminados': 0, 'ignorados': 0, 'invalidas': 0}
+    for linea in lineas:
+        linea = linea.strip()
+        if not linea or linea.startswith('#'):
+            continue
+        comando, _, elemento = linea.partition(' ')
+        comando = comando.lower()
+        elemento = elemento.strip()
+        if comando == 'agregar' and elemento:
+            clave = 'agregados' if almacen.agregar(elemento) else 'ignorados'
+        elif comando == 'eliminar' and elemento:
+            clave = 'eliminados' if almacen.eliminar(elemento) else 'ignorados'
+        elif comando == 'compactar':
+            almacen.compactar()
+            continue
+        else:
+            clave = 'invalidas'
+        resumen[clave] += 1
+    return resumen
+
+
+def main_lote(ruta_almacen: str, ruta_comandos: str = None) -> None:
+    """Modo no interactivo: lee comandos de un archivo o de stdin y muestra un resumen.
+
+    Al terminar el log se baja a disco, así el resumen mostrado ya es durable.
+
+    Args:
+        ruta_almacen (str): Ruta base del almacén en disco.
+        ruta_comandos (str, optional): Archivo de comandos. Si es None se lee de stdin.
+    """
+    with AlmacenConjunto(ruta_almacen) as almacen:
+        if ruta_comandos is None:
+            resumen = procesar_lote(sys.stdin, almacen)
+        else:
+            with open(ruta_comandos, 'r', encoding='utf-8') as archivo:
+                resumen = procesar_lote(archivo, almacen)
+        almacen.sincronizar()
+        print(f"Agregados: {resumen['agregados']} | Eliminados: {resumen['eliminados']} | "
+              f"Ignorados: {resumen['ignorados']} | Inválidos: {resumen['invalidas']}")
+        print(f"Conjunto: {almacen.resumen()}")
+
+
+def vista_previa(conjunto, cantidad: int = 5) -> str:
+    """Resume un conjunto sin listar todos sus elementos.
+
+    Args:
+        conjunto: Conjunto a resumir.
+        cantidad (int): Elementos a mostrar como muestra.
+
+    Returns:
+        str: La cantidad de elementos y algunos de ellos.
+
+    Example:
+        >>> vista_previa({'a'})
+        "1 elementos: 'a'"
+        >>> vista_previa(set())
+        '0 elementos'
+    """
+    muestra = list(islice(conjunto, cantidad))
+    texto = f"{len(conjunto)} elementos"
+    if muestra:
+        texto += ": " + ", ".join(repr(elemento) for elemento in muestra)
+        if len(conjunto) > cantidad:
+            texto += ", ..."
+    return texto
+
+
 def mostrar_menu():
     print("\n" + "="*50)
     print("           GESTOR DE CONJUNTOS")
@@ -53,7 +140,7 @@ def main():
         opcion = input("Selecciona una opción (1-4): ")
         if opcion == "1":
             conjunto_actual = crear_conjunto()
-            print(f"\nConjunto creado exitosamente: {conjunto_actual}")
+            print(f"\nConjunto creado exitosamente: {vista_previa(conjunto_actual)}")
             
         elif opcion == "2":
             if not conjunto_actual:
@@ -65,7 +152,7 @@ def main():
             if not conjunto_actual:
                 print("No hay un conjunto creado.")
             else:
-                print(f"Conjunto actual: {conjunto_actual}")
+                print(f"Conjunto actual: {vista_previa(conjunto_actual)}")
                 
         elif opcion == "4":
             print("Chau")
@@ -74,4 +161,23 @@ def main():
         else:
             print("Opción no válida. Por favor, seleccioná una opción del 1 al 4.")
 
-main() 
\ No newline at end of file
+
+def main_cli():
+    # python -m TP1.punto02 --almacen conjunto [--lote comandos.txt]
+    # sin --lote los comandos se leen de stdin (ej: cat comandos.txt | python -m TP1.punto02 --almacen conjunto)
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gestor de conjuntos (interactivo, o por lotes con --almacen)")
+    parser.add_argument("--almacen", help="ruta base del almacén en disco; activa el modo por lotes")
+    parser.add_argument("--lote", help="archivo de comandos (por defecto se leen de stdin)")
+    argumentos = parser.parse_args(sys.argv[1:])
+    if argumentos.lote is not None and argumentos.almacen is None:
+        parser.error("--lote necesita --almacen")
+    if argumentos.almacen is not None:
+        main_lote(argumentos.almacen, argumentos.lote)
+    else:
+        main()
+
+
+if __name__ == "__main__":
+    main_cli()
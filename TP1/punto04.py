@@ -1,6 +1,12 @@
 def eliminar_duplicados(lista):
     return list(set(lista))
 
-cadenas = ["phyton", "java", "c", "c#", "javascript", "go", "java","javascript"]
-resultado = eliminar_duplicados(cadenas)
-print(resultado)
\ No newline at end of file
+
+def main():
+    cadenas = ["phyton", "java", "c", "c#", "javascript", "go", "java","javascript"]
+    resultado = eliminar_duplicados(cadenas)
+    print(resultado)
+
+
+if __name__ == "__main__":
+    main()
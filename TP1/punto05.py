@@ -4,4 +4,10 @@ def factorial(n):
     else:
         return n * factorial(n-1)
 
-print(factorial(4))
\ No newline at end of file
+
+def main():
+    print(factorial(4))
+
+
+if __name__ == "__main__":
+    main()
@@ -9,5 +9,11 @@ def fibonacci(n):
         secuencia.append(siguiente)
     return secuencia
 
-# Ejemplo de uso
-print(fibonacci(5))  # Salida esperada: [0, 1, 1, 2, 3]
\ No newline at end of file
+
+def main():
+    # Ejemplo de uso
+    print(fibonacci(5))  # Salida esperada: [0, 1, 1, 2, 3]
+
+
+if __name__ == "__main__":
+    main()
@@ -4,4 +4,10 @@ def suma_recursiva(n):
     else:
         return n + suma_recursiva(n-1)
 
-print(suma_recursiva(5))
\ No newline at end of file
+
+def main():
+    print(suma_recursiva(5))
+
+
+if __name__ == "__main__":
+    main()
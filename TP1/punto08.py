@@ -10,7 +10,13 @@ def slicing_function(texto):
 
     return dictionary
 
-text = "Nombre: Juan Pérez | Edad: 30 | Ciudad: Salta"
-print(slicing_function(text)) # {"nombre": " Juan Perez", "edad" : 30, "ciudad": "Salta"}
-text2 = "Nombre: Ana García | Edad: 25 | Ciudad: Buenos Aires"
-print(slicing_function(text2)) # {"nombre": " Ana Garcia", "edad" : 25, "ciudad": "Buenos Aires"}   
\ No newline at end of file
+
+def main():
+    text = "Nombre: Juan Pérez | Edad: 30 | Ciudad: Salta"
+    print(slicing_function(text)) # {"nombre": " Juan Perez", "edad" : 30, "ciudad": "Salta"}
+    text2 = "Nombre: Ana García | Edad: 25 | Ciudad: Buenos Aires"
+    print(slicing_function(text2)) # {"nombre": " Ana Garcia", "edad" : 25, "ciudad": "Buenos Aires"}
+
+
+if __name__ == "__main__":
+    main()
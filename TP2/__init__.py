@@ -0,0 +1 @@
+"""Trabajo Práctico 2."""
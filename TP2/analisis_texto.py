@@ -0,0 +1,200 @@
+import re
+import unicodedata
+
+_PALABRA = re.compile(r'\S+')
+TAMANIO_BLOQUE = 1 << 20  # caracteres por bloque al leer archivos
+
+
+def _contar_bloque(bloque: str) -> tuple[int, int, bool, bool]:
+    """Cuenta palabras y caracteres de un bloque sin armar la lista de palabras.
+
+    Args:
+        bloque (str): Fragmento de texto.
+
+    Returns:
+        tuple[int, int, bool, bool]: (palabras, caracteres, empieza_en_palabra, termina_en_palabra).
+        Los dos últimos valores sirven para unir bloques contiguos.
+    """
+    palabras = sum(1 for _ in _PALABRA.finditer(bloque))
+    empieza = bool(bloque) and not bloque[0].isspace()
+    termina = bool(bloque) and not bloque[-1].isspace()
+    return palabras, len(bloque), empieza, termina
+
+
+def _combinar(parciales) -> dict:
+    """Combina los resultados de bloques contiguos, en orden.
+
+    Si un bloque termina en medio de una palabra y el siguiente empieza con
+    letras, esa palabra se contó dos veces y se descuenta una.
+    """
+    cantidad_palabras = 0
+    cantidad_caracteres = 0
+    anterior_termina_en_palabra = False
+    for palabras, caracteres, empieza, termina in parciales:
+        cantidad_palabras += palabras
+        if anterior_termina_en_palabra and empieza:
+            cantidad_palabras -= 1
+        cantidad_caracteres += caracteres
+        if caracteres:
+            anterior_termina_en_palabra = termina
+    return {'cantidad_palabras': cantidad_palabras, 'cantidad_caracteres': cantidad_caracteres}
+
+
+def leer_bloques(ruta: str, tamanio_bloque: int = TAMANIO_BLOQUE):
+    """Generador que lee un archivo de texto en bloques de tamaño fijo.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        tamanio_bloque (int): Cantidad de caracteres por bloque.
+
+    Yields:
+        str: El siguiente bloque del archivo.
+    """
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        while True:
+            bloque = archivo.read(tamanio_bloque)
+            if not bloque:
+                break
+            yield bloque
+
+
+def contar_palabras_y_caracteres(bloques, procesos: int = 1) -> dict:
+    """Cuenta palabras y caracteres de un texto que llega en bloques.
+
+    Equivale a ``cantidad_de_palabras_y_caracteres`` de punto4 pero sin tener
+    todo el texto en memoria ni construir la lista de palabras. Las palabras
+    cortadas entre dos bloques se cuentan una sola vez.
+
+    Args:
+        bloques: Iterable de strings contiguos (por ejemplo ``leer_bloques(ruta)``).
+        procesos (int): Si es mayor a 1, los bloques se cuentan en paralelo.
+
+    Returns:
+        dict: {'cantidad_palabras': int, 'cantidad_caracteres': int}
+
+    Examples:
+        >>> contar_palabras_y_caracteres(["hola mu", "ndo  ", "chau"])
+        {'cantidad_palabras': 3, 'cantidad_caracteres': 16}
+    """
+    if procesos > 1:
+        from multiprocessing import Pool  # solo se importa si se pide paralelismo
+        with Pool(procesos) as pool:
+            return _combinar(pool.imap(_contar_bloque, bloques))
+    return _combinar(map(_contar_bloque, bloques))
+
+
+def contar_archivo(ruta: str, procesos: int = 1, tamanio_bloque: int = TAMANIO_BLOQUE) -> dict:
+    """Cuenta palabras y caracteres de un archivo leyéndolo en bloques.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        procesos (int): Cantidad de procesos a usar.
+        tamanio_bloque (int): Cantidad de caracteres por bloque.
+
+    Returns:
+        dict: {'cantidad_palabras': int, 'cantidad_caracteres': int}
+    """
+    return contar_palabras_y_caracteres(leer_bloques(ruta, tamanio_bloque), procesos)
+
+
+def _normalizar_caracter(caracter: str, ignorar_acentos: bool) -> str:
+    caracter = caracter.casefold()
+    if ignorar_acentos:
+        # NFD separa "é" en "e" + acento; nos quedamos con la letra base
+        caracter = unicodedata.normalize('NFD', caracter)[0]
+    return caracter
+
+
+def es_palindromo(texto: str, ignorar_acentos: bool = True, solo_alfanumericos: bool = False) -> bool:
+    """Verifica si un texto es un palíndromo comparando desde los dos extremos.
+
+    A diferencia de ``verificacion_de_palindromos`` no crea una copia invertida:
+    recorre el texto con dos índices que avanzan hacia el centro.
+
+    Args:
+        texto (str): Texto a verificar.
+        ignorar_acentos (bool): Si es True, "é" y "e" se consideran iguales.
+        solo_alfanumericos (bool): Si es True, se saltean espacios y signos de puntuación.
+
+    Returns:
+        bool: True si el texto es un palíndromo, False en caso contrario.
+
+    Examples:
+        >>> es_palindromo("Neuquén")
+        True
+        >>> es_palindromo("Neuquén", ignorar_acentos=False)
+        False
+        >>> es_palindromo("Anita lava la tina", solo_alfanumericos=True)
+        True
+        >>> es_palindromo(unicodedata.normalize('NFD', "Neuquén"))
+        True
+    """
+    if not ignorar_acentos and not unicodedata.is_normalized('NFC', texto):
+        # los acentos cuentan: "e" + acento suelto tiene que compararse como "é"
+        texto = unicodedata.normalize('NFC', texto)
+    izquierda = 0
+    derecha = len(texto) - 1
+    while izquierda < derecha:
+        # un acento ya separado de su letra (texto en NFD) no se compara
+        if ignorar_acentos and unicodedata.combining(texto[izquierda]):
+            izquierda += 1
+            continue
+        if ignorar_acentos and unicodedata.combining(texto[derecha]):
+            derecha -= 1
+            continue
+        if solo_alfanumericos and not texto[izquierda].isalnum():
+            izquierda += 1
+            continue
+        if solo_alfanumericos and not texto[derecha].isalnum():
+            derecha -= 1
+            continue
+        if (_normalizar_caracter(texto[izquierda], ignorar_acentos)
+                != _normalizar_caracter(texto[derecha], ignorar_acentos)):
+            return False
+        izquierda += 1
+        derecha -= 1
+    return True
+
+
+def _linea_es_palindromo(linea: str) -> bool:
+    return es_palindromo(linea.rstrip('\n'), solo_alfanumericos=True)
+
+
+def contar_palindromos_en_archivo(ruta: str, procesos: int = 1) -> dict:
+    """Recorre un archivo línea por línea y cuenta cuántas líneas son palíndromos.
+
+    Las líneas vacías no se cuentan.
+
+    Args:
+        ruta (str): Ruta del archivo.
+        procesos (int): Si es mayor a 1, las líneas se verifican en paralelo.
+
+    Returns:
+        dict: {'lineas': int, 'palindromos': int}
+    """
+    lineas = 0
+    palindromos = 0
+    with open(ruta, 'r', encoding='utf-8') as archivo:
+        no_vacias = (linea for linea in archivo if linea.strip())
+        if procesos > 1:
+            from multiprocessing import Pool
+            with Pool(procesos) as pool:
+                resultados = pool.imap(_linea_es_palindromo, no_vacias, chunksize=10_000)
+                for resultado in resultados:
+                    lineas += 1
+                    palindromos += resultado
+        else:
+            for linea in no_vacias:
+                lineas += 1
+                palindromos += _linea_es_palindromo(linea)
+    return {'lineas': lineas, 'palindromos': palindromos}
+
+
+def main():
+    print(contar_palabras_y_caracteres(["hola mu", "ndo  ", "chau"]))
+    for palabra in ["Neuquén", "hola", "Anita lava la tina"]:
+        print(f"{palabra}: {es_palindromo(palabra, solo_alfanumericos=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+import csv
+import os
+import sys
+from array import array
+from functools import lru_cache
+
+from utilidades import cargar_numpy
+
+# Para cada unidad: (a, b) tal que celsius = valor * a + b
+# y (m, n) tal que valor = celsius * m + n
+_A_CELSIUS = {
+    'C': (1.0, 0.0),
+    'F': (5 / 9, -32 * 5 / 9),
+    'K': (1.0, -273.15),
+    'R': (5 / 9, -273.15),
+}
+_DESDE_CELSIUS = {
+    'C': (1.0, 0.0),
+    'F': (9 / 5, 32.0),
+    'K': (1.0, 273.15),
+    'R': (9 / 5, 273.15 * 9 / 5),
+}
+
+
+@lru_cache(maxsize=None)
+def transformacion_temperatura(unidad_origen: str, unidad_destino: str) -> tuple[float, float]:
+    """Resuelve un par de unidades a una transformación afín ``destino = origen * escala + desplazamiento``.
+
+    El resultado se cachea, así que validar las unidades y llamar a ``upper()``
+    se hace una sola vez por par en lugar de una vez por valor.
+
+    Args:
+        unidad_origen (str): 'C', 'F', 'K' (Kelvin) o 'R' (Rankine).
+        unidad_destino (str): 'C', 'F', 'K' o 'R'.
+
+    Returns:
+        tuple[float, float]: (escala, desplazamiento).
+
+    Raises:
+        ValueError: Si alguna de las unidades no es válida.
+
+    Examples:
+        >>> transformacion_temperatura('c', 'F')
+        (1.8, 32.0)
+    """
+    origen = unidad_origen.upper()
+    destino = unidad_destino.upper()
+    if origen not in _A_CELSIUS or destino not in _DESDE_CELSIUS:
+        raise ValueError("Unidades de origen o destino no válidas. Use 'C', 'F', 'K' o 'R'.")
+    if origen == destino:
+        return 1.0, 0.0
+    a, b = _A_CELSIUS[origen]
+    m, n = _DESDE_CELSIUS[destino]
+    return a * m, b * m + n
+
+
+def _es_arreglo_numpy(valores) -> bool:
+    # numpy es opcional y no se importa acá: si nos pasaron un ndarray, ya está cargado
+    np = sys.modules.get('numpy')
+    return np is not None and isinstance(valores, np.ndarray)
+
+
+def _verificar_en_lugar(valores) -> None:
+    """Un resultado con decimales solo se puede escribir sobre un buffer de punto flotante."""
+    if _es_arreglo_numpy(valores):
+        if valores.dtype.kind != 'f':
+            raise TypeError(f"en_lugar=True necesita un arreglo de punto flotante, no de {valores.dtype}; "
+                            "use valores.astype(float) o en_lugar=False")
+    elif isinstance(valores, array) and valores.typecode not in 'fd':
+        raise TypeError(f"en_lugar=True necesita un array('d') o array('f'), no array('{valores.typecode}')")
+
+
+def _vista_numpy(valores):
+    """Devuelve un ndarray que comparte memoria con un array('d')/array('f'), o None.
+
+    Así la conversión en el lugar de un array es vectorizada y sin copias.
+    Sin NumPy instalado devuelve None y se usa el bucle en Python.
+    """
+    if not isinstance(valores, array) or valores.typecode not in 'fd' or not valores:
+        return None
+    np = cargar_numpy()
+    if np is None:
+        return None
+    return np.frombuffer(valores, dtype=np.float64 if valores.typecode == 'd' else np.float32)
+
+
+def _aplicar_afin(valores, escala: float, desplazamiento: float, en_lugar: bool):
+    """Aplica ``valor * escala + desplazamiento`` a un arreglo de NumPy, un array('d') o un iterable."""
+    if en_lugar:
+        _verificar_en_lugar(valores)
+        vista = _vista_numpy(valores)
+        if vista is not None:
+            vista *= escala
+            vista += desplazamiento
+            return valores
+    if _es_arreglo_numpy(valores):
+        if en_lugar:
+            valores *= escala
+            valores += desplazamiento
+            return valores
+        return valores * escala + desplazamiento
+    if en_lugar:
+        for i, valor in enumerate(valores):
+            valores[i] = valor * escala + desplazamiento
+        return valores
+    return array('d', [valor * escala + desplazamiento for valor in valores])
+
+
+def convertir_temperaturas(temperaturas, unidad_origen: str, unidad_destino: str, en_lugar: bool = False):
+    """Convierte muchas temperaturas de una vez.
+
+    Args:
+        temperaturas: Arreglo de NumPy, array('d') o cualquier iterable de números.
+        unidad_origen (str): 'C', 'F', 'K' o 'R'.
+        unidad_destino (str): 'C', 'F', 'K' o 'R'.
+        en_lugar (bool): Si es True se sobrescribe ``temperaturas``. Tiene que ser mutable
+            y, si es un arreglo de NumPy o un array, de punto flotante.
+
+    Returns:
+        Un arreglo de NumPy si la entrada lo era; si no, un array('d').
+        Con ``en_lugar=True`` se devuelve el mismo objeto recibido.
+
+    Raises:
+        ValueError: Si alguna de las unidades no es válida.
+        TypeError: Si ``en_lugar=True`` y el arreglo no es de punto flotante.
+
+    Examples:
+        >>> list(convertir_temperaturas([0, 100], 'C', 'F'))
+        [32.0, 212.0]
+        >>> list(convertir_temperaturas([0], 'C', 'K'))
+        [273.15]
+    """
+    escala, desplazamiento = transformacion_temperatura(unidad_origen, unidad_destino)
+    return _aplicar_afin(temperaturas, escala, desplazamiento, en_lugar)
+
+
+def calcular_descuentos(precios, porcentaje_descuento, en_lugar: bool = False):
+    """Versión masiva de ``calcularDescuento``.
+
+    Args:
+        precios: Arreglo de NumPy, array('d') o iterable de precios.
+        porcentaje_descuento: Un porcentaje para todos los precios, o un arreglo
+            del mismo largo con un porcentaje por precio.
+        en_lugar (bool): Si es True se sobrescribe ``precios`` (como en ``convertir_temperaturas``,
+            un arreglo de NumPy o un array tiene que ser de punto flotante).
+
+    Returns:
+        Los precios finales, del mismo tipo que en ``convertir_temperaturas``.
+
+    Raises:
+        TypeError: Si ``en_lugar=True`` y el arreglo no es de punto flotante.
+        ValueError: Si hay una lista de porcentajes de distinto largo que los precios.
+
+    Examples:
+        >>> list(calcular_descuentos([100, 200], 10))
+        [90.0, 180.0]
+        >>> list(calcular_descuentos([100, 200], [50, 25]))
+        [50.0, 150.0]
+    """
+    if isinstance(porcentaje_descuento, (int, float)):
+        return _aplicar_afin(precios, 1 - porcentaje_descuento / 100, 0.0, en_lugar)
+    if en_lugar:
+        _verificar_en_lugar(precios)
+    if _es_arreglo_numpy(precios):
+        factores = 1 - sys.modules['numpy'].asarray(porcentaje_descuento, dtype=float) / 100
+        if en_lugar:
+            precios *= factores
+            return precios
+        return precios * factores
+    if en_lugar:
+        if len(porcentaje_descuento) != len(precios):
+            raise ValueError("Hace falta un porcentaje por precio")
+        vista = _vista_numpy(precios)
+        if vista is not None:
+            vista *= 1 - sys.modules['numpy'].asarray(porcentaje_descuento, dtype=float) / 100
+            return precios
+        for i, porcentaje in enumerate(porcentaje_descuento):
+            precios[i] = precios[i] * (1 - porcentaje / 100)
+        return precios
+    try:
+        return array('d', [precio * (1 - porcentaje / 100)
+                           for precio, porcentaje in zip(precios, porcentaje_descuento, strict=True)])
+    except ValueError:
+        raise ValueError("Hace falta un porcentaje por precio") from None
+
+
+def convertir_columna_csv(entrada: str, salida: str, columna: str, unidad_origen: str,
+                          unidad_destino: str, tamanio_lote: int = 10_000) -> int:
+    """Convierte una columna de temperaturas de un CSV sin cargar todo el archivo.
+
+    Las filas se leen y escriben por lotes; dentro de cada lote la columna se
+    convierte de una sola vez con ``convertir_temperaturas``. Las celdas vacías
+    quedan vacías. La salida se escribe en un archivo temporal que reemplaza a
+    ``salida`` solo si todo salió bien, así un error no deja un CSV a medias.
+
+    Args:
+        entrada (str): Ruta del CSV de entrada (con encabezado).
+        salida (str): Ruta del CSV de salida.
+        columna (str): Nombre de la columna a convertir.
+        unidad_origen (str): Unidad de los valores de entrada.
+        unidad_destino (str): Unidad de los valores de salida.
+        tamanio_lote (int): Cantidad de filas por lote.
+
+    Returns:
+        int: Cantidad de filas convertidas (sin contar las de celda vacía).
+
+    Raises:
+        ValueError: Si el archivo está vacío, la columna no existe, algún valor
+            no es numérico o las unidades no son válidas.
+    """
+    escala, desplazamiento = transformacion_temperatura(unidad_origen, unidad_destino)
+    filas_convertidas = 0
+    with open(entrada, 'r', encoding='utf-8', newline='') as archivo_entrada:
+        lector = csv.reader(archivo_entrada)
+        encabezado = next(lector, None)
+        if encabezado is None:
+            raise ValueError(f"{entrada} está vacío: falta el encabezado")
+        if columna not in encabezado:
+            raise ValueError(f"La columna {columna} no existe en {entrada}")
+        indice = encabezado.index(columna)
+        temporal = salida + ".tmp"
+        try:
+            with open(temporal, 'w', encoding='utf-8', newline='') as archivo_salida:
+                escritor = csv.writer(archivo_salida)
+                escritor.writerow(encabezado)
+                lote = []
+                for fila in lector:
+                    lote.append(fila)
+                    if len(lote) == tamanio_lote:
+                        filas_convertidas += _convertir_lote(lote, indice, escala, desplazamiento,
+                                                             escritor, lector.line_num - len(lote) + 1)
+                        lote = []
+                if lote:
+                    filas_convertidas += _convertir_lote(lote, indice, escala, desplazamiento,
+                                                         escritor, lector.line_num - len(lote) + 1)
+            os.replace(temporal, salida)
+        except BaseException:
+            if os.path.exists(temporal):
+                os.remove(temporal)
+            raise
+    return filas_convertidas
+
+
+def _convertir_lote(lote, indice, escala, desplazamiento, escritor, primera_linea: int) -> int:
+    """Convierte la columna de un lote de filas y las escribe. Devuelve cuántas celdas se convirtieron."""
+    con_valor = []
+    for numero, fila in enumerate(lote, primera_linea):
+        celda = fila[indice].strip() if indice < len(fila) else ''
+        if not celda:
+            continue
+        try:
+            con_valor.append((fila, float(celda)))
+        except ValueError:
+            raise ValueError(f"Valor no numérico {celda!r} en la línea {numero}") from None
+    valores = array('d', [valor for _, valor in con_valor])
+    _aplicar_afin(valores, escala, desplazamiento, en_lugar=True)
+    for (fila, _), valor in zip(con_valor, valores):
+        fila[indice] = valor
+    escritor.writerows(lote)
+    return len(con_valor)
+
+
+def main():
+    print(list(convertir_temperaturas([0, 25, 100], 'C', 'F')))
+    print(list(convertir_temperaturas([32, 68, 212], 'F', 'C')))
+    print(list(convertir_temperaturas([0, 100], 'C', 'K')))
+    print(list(calcular_descuentos([1000, 2500], 15)))
+
+
+if __name__ == "__main__":
+    main()
@@ -18,4 +18,6 @@ def main():
     precio_final = calcularDescuento(precio, porcentaje_descuento)
     print(f"El precio final después de aplicar el descuento es: {precio_final:.2f}")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
@@ -39,4 +39,6 @@ def main():
      temp_celsius_2 = convertirTemperatura(temp_fahrenheit_2, 'F', 'C')
      print(f"{temp_fahrenheit_2}°F es igual a {temp_celsius_2}°C")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
@@ -26,4 +26,6 @@ def main():
     if not verificacion_de_palindromos(palabra_no_palindroma):
         print(f"{palabra_no_palindroma} no es un palíndromo.")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
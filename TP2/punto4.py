@@ -23,4 +23,6 @@ def main():
     print(f"La cantidad de palabras es: {resultado['cantidad_palabras']}")
     print(f"La cantidad de caracteres es: {resultado['cantidad_caracteres']}")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
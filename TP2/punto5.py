@@ -54,4 +54,5 @@ def main():
     print("primos hasta 1000: ", generar_primos_hasta(1000))
 
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
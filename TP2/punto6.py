@@ -1,3 +1,7 @@
+from instrumentacion import instrumentar
+
+
+@instrumentar
 def actualizar_inventario(inventario: dict[str, int], producto_vendido: list[str]) -> dict[str, int]:
     """
     Actualiza el inventario de una tienda restando los artículos vendidos.
@@ -51,5 +55,5 @@ def main():
     print("inventario: ", inventario_actualizado)
 
 
-
-main()
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,12 @@
+import sys
+from array import array
+
+# ancho de cada carácter según el mayor código del corpus -> (tipo de array, codec)
+# los arrays usan el orden de bytes de la máquina, así que el codec también
+_ORDEN = 'le' if sys.byteorder == 'little' else 'be'
+_ANCHOS = ((0xFF, 'B', 'latin-1'), (0xFFFF, 'H', f'utf-16-{_ORDEN}'), (0x10FFFF, 'I', f'utf-32-{_ORDEN}'))
+
+
 def convertir_strings_a_caracteres(lista_strings: list[str]):
     """
     Convierte una lista de strings en una nueva lista con listas de caracteres utilizando map.
@@ -13,8 +22,143 @@ def convertir_strings_a_caracteres(lista_strings: list[str]):
     #le aplico con map la funcion list a la lista de string
     return list(map(list,lista_strings))
 
-print(convertir_strings_a_caracteres(["hola","adios"]))
-print(convertir_strings_a_caracteres(["python", "map", "list"]))
 
+class FilaCaracteres:
+    """
+    Vista de solo lectura sobre los caracteres de un string dentro de CaracteresCompactos.
 
-    
+    Se indexa como una lista de caracteres (fila[j], len, iteración, slicing) pero
+    no copia nada: guarda un memoryview sobre los códigos del corpus.
+    """
+
+    __slots__ = ("_codigos",)
+
+    def __init__(self, codigos: memoryview) -> None:
+        self._codigos = codigos
+
+    def __len__(self) -> int:
+        return len(self._codigos)
+
+    def __getitem__(self, j):
+        if isinstance(j, slice):
+            return FilaCaracteres(self._codigos[j])
+        return chr(self._codigos[j])
+
+    def __iter__(self):
+        return map(chr, self._codigos)
+
+    def __eq__(self, otro) -> bool:
+        # igual que una lista: se compara con listas, tuplas u otras filas, no con str
+        if isinstance(otro, FilaCaracteres):
+            return self._codigos.tolist() == otro._codigos.tolist()
+        if isinstance(otro, (list, tuple)):
+            return list(self) == list(otro)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def codigos(self) -> memoryview:
+        """Devuelve los códigos Unicode de la fila (ej: para np.frombuffer)."""
+        return self._codigos
+
+
+class CaracteresCompactos:
+    """
+    Alternativa compacta a convertir_strings_a_caracteres para corpus grandes.
+
+    Todos los caracteres se guardan en un único array contiguo, con 1, 2 o 4
+    bytes por carácter según el mayor código Unicode del corpus (como hace el
+    propio str de Python), más un índice de offsets de 8 bytes por string.
+    Un corpus de texto latino ocupa así aproximadamente lo mismo que el texto
+    original, en lugar de ~8 bytes de puntero por carácter de una lista de listas.
+
+    resultado[i][j] devuelve el carácter j del string i, como con listas, y
+    resultado[a:b] una lista de filas. Los strings pueden tener surrogates sueltos.
+
+    Examples:
+        >>> resultado = CaracteresCompactos(["hola", "adiós"])
+        >>> resultado[1][3], len(resultado[1])
+        ('ó', 5)
+        >>> resultado[0]
+        ['h', 'o', 'l', 'a']
+        >>> resultado[1:]
+        [['a', 'd', 'i', 'ó', 's']]
+        >>> resultado == convertir_strings_a_caracteres(["hola", "adiós"])
+        True
+        >>> CaracteresCompactos(["a\\ud800"])[0][1] == "\\ud800"
+        True
+    """
+
+    def __init__(self, lista_strings: list[str]) -> None:
+        """
+        Args:
+            lista_strings (list[str]): Strings a convertir. Se recorren dos veces.
+        """
+        mayor = max((ord(max(s)) for s in lista_strings if s), default=0)
+        _, tipo, codec = next(ancho for ancho in _ANCHOS if mayor <= ancho[0])
+        self._caracteres = array(tipo)
+        self._offsets = array('Q', [0])
+        for s in lista_strings:
+            # surrogatepass: un surrogate suelto es un código más, como en str
+            self._caracteres.frombytes(s.encode(codec, 'surrogatepass'))
+            self._offsets.append(len(self._caracteres))
+        self._vista = memoryview(self._caracteres)
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[k] for k in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("índice fuera de rango")
+        return FilaCaracteres(self._vista[self._offsets[i]:self._offsets[i + 1]])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def __eq__(self, otro) -> bool:
+        # permite comparar directamente con el resultado de convertir_strings_a_caracteres
+        if not isinstance(otro, (CaracteresCompactos, list, tuple)):
+            return NotImplemented
+        return len(self) == len(otro) and all(fila == otra for fila, otra in zip(self, otro))
+
+    def bytes_usados(self) -> int:
+        """Devuelve la memoria ocupada por los caracteres y el índice, en bytes."""
+        return (len(self._caracteres) * self._caracteres.itemsize
+                + len(self._offsets) * self._offsets.itemsize)
+
+
+def iterar_caracteres(lista_strings):
+    """
+    Versión perezosa: por cada string devuelve un iterador de sus caracteres.
+
+    No arma ninguna lista ni copia los strings, así que sirve para recorrer
+    corpus que no entran en memoria (por ejemplo, las líneas de un archivo).
+
+    Args:
+        lista_strings: Cualquier iterable de strings.
+
+    Yields:
+        Iterator[str]: Los caracteres de cada string, uno por uno.
+
+    Examples:
+        >>> [list(caracteres) for caracteres in iterar_caracteres(["ab", "c"])]
+        [['a', 'b'], ['c']]
+    """
+    return map(iter, lista_strings)
+
+
+def main():
+    print(convertir_strings_a_caracteres(["hola","adios"]))
+    print(convertir_strings_a_caracteres(["python", "map", "list"]))
+    compactos = CaracteresCompactos(["python", "map", "list"])
+    print(list(compactos), compactos[0][1])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,9 @@
 from functools import reduce
 
+from instrumentacion import instrumentar
+
+
+@instrumentar
 def stats(lista_de_numeros: list[float]) -> dict[str:float]:
     """
     Calcula estadísticas de una lista de números.
@@ -56,9 +60,15 @@ def stats(lista_de_numeros: list[float]) -> dict[str:float]:
     }
     return dict;
 
-print(stats([1, 2, 3, 4, 5])) #{'media': 3.0, 'mediana': 3, 'moda': 1}
-print(stats([1, 2, 2, 3, 4])) #{'media': 3.0, 'mediana': 3, 'moda': 1}
-lista_de_numeros = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
-print(stats(lista_de_numeros)) #{'media': 5.5, 'mediana': 5.5, 'moda': 10}
-lista_de_numeros = [1, 2, 3, 4, 4, 4, 4.1, 5, 1, 10] #{'media': 3.81, 'mediana': 4.0, 'moda': 4}
-print(stats(lista_de_numeros))
+
+def main():
+    print(stats([1, 2, 3, 4, 5])) #{'media': 3.0, 'mediana': 3, 'moda': 1}
+    print(stats([1, 2, 2, 3, 4])) #{'media': 3.0, 'mediana': 3, 'moda': 1}
+    lista_de_numeros = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+    print(stats(lista_de_numeros)) #{'media': 5.5, 'mediana': 5.5, 'moda': 10}
+    lista_de_numeros = [1, 2, 3, 4, 4, 4, 4.1, 5, 1, 10] #{'media': 3.81, 'mediana': 4.0, 'moda': 4}
+    print(stats(lista_de_numeros))
+
+
+if __name__ == "__main__":
+    main()
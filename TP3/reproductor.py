@@ -9,19 +9,150 @@ by implementing a base class and concrete implementations for each audio source.
 - Concrete implementations for MP3, CD, Console, Cassette, and FM audio sources
 - Player class that uses polymorphism to switch between sources seamlessly
 - No conditional logic required for source switching
+- Sources are stateless flyweights: a single shared instance per source lives in SOURCES
+- Sources can stream PCM audio in chunks (read_chunks); the async player lives in streaming.py
 
 """
 
+import math
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, Iterator, Optional, TextIO, Union
+
+SAMPLE_RATE = 48000  # frames per second
+CHANNELS = 2  # stereo
+SAMPLE_WIDTH = 2  # 16-bit signed PCM
+FRAME_SIZE = CHANNELS * SAMPLE_WIDTH
+CHUNK_SIZE = 4096  # bytes per chunk, 1024 frames
+
+
+def _pcm_data_range(mapped: mmap.mmap) -> tuple[int, int]:
+    """
+    Finds where the PCM samples start and end inside a mapped file.
+
+    WAV files are walked chunk by chunk: the "fmt " chunk must describe the
+    format the player streams (16-bit PCM, CHANNELS channels at SAMPLE_RATE)
+    and the "data" chunk holds the samples. Anything else is treated as raw
+    PCM in that format and used whole. A trailing partial frame is left out.
+
+    Args:
+        mapped (mmap.mmap): The mapped file.
+
+    Returns:
+        tuple[int, int]: Start and end offsets of the samples.
+
+    Raises:
+        ValueError: If a WAV file has another format, or no "fmt " or "data" chunk.
+    """
+    if mapped[:4] != b"RIFF" or mapped[8:12] != b"WAVE":
+        return 0, len(mapped) - len(mapped) % FRAME_SIZE
+    offset = 12
+    format_checked = False
+    while offset + 8 <= len(mapped):
+        chunk_id = mapped[offset:offset + 4]
+        (chunk_length,) = struct.unpack_from("<I", mapped, offset + 4)
+        offset += 8
+        if chunk_id == b"fmt ":
+            if chunk_length < 16 or offset + 16 > len(mapped):
+                raise ValueError("WAV file has a truncated fmt chunk")
+            audio_format, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", mapped, offset)
+            # 1 = PCM, 0xFFFE = WAVE_FORMAT_EXTENSIBLE (PCM with a longer header)
+            if (audio_format not in (1, 0xFFFE) or channels != CHANNELS
+                    or sample_rate != SAMPLE_RATE or bits != SAMPLE_WIDTH * 8):
+                raise ValueError(
+                    f"Unsupported WAV format: {channels} channel(s), {sample_rate} Hz, {bits}-bit "
+                    f"(format {audio_format}); expected {CHANNELS} channels, {SAMPLE_RATE} Hz, "
+                    f"{SAMPLE_WIDTH * 8}-bit PCM")
+            format_checked = True
+        elif chunk_id == b"data":
+            if not format_checked:
+                raise ValueError("WAV file has no fmt chunk before its data")
+            end = min(offset + chunk_length, len(mapped))
+            return offset, end - (end - offset) % FRAME_SIZE
+        offset += chunk_length + (chunk_length & 1)  # chunks are word aligned
+    raise ValueError("WAV file has no data chunk")
+
+
+def read_mapped_chunks(path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+    """
+    Yields the samples of a WAV or raw PCM file as memoryview slices of a memory map.
+
+    Nothing is copied: each slice points straight into the mapped file. The file
+    is opened and its header checked right away, so a bad path fails in this
+    call instead of on the first chunk.
+
+    Args:
+        path (str): Path to a WAV or raw PCM file.
+        chunk_size (int): Bytes per chunk.
+
+    Returns:
+        Iterator[memoryview]: The chunks of samples. The last one may be shorter.
+
+    Raises:
+        ValueError: If no path is given, the file is empty or a WAV file is not
+            16-bit PCM with CHANNELS channels at SAMPLE_RATE (or has no data chunk).
+        OSError: If the file cannot be opened.
+    """
+    if path is None:
+        raise ValueError("This source needs a file to stream")
+    with open(path, "rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start, end = _pcm_data_range(mapped)
+    except ValueError:
+        mapped.close()
+        raise
+    return _iterate_mapped(mapped, start, end, chunk_size)
+
+
+def _iterate_mapped(mapped: mmap.mmap, start: int, end: int, chunk_size: int) -> Iterator[memoryview]:
+    view = memoryview(mapped)
+    try:
+        for offset in range(start, end, chunk_size):
+            yield view[offset:min(offset + chunk_size, end)]
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # a consumer still holds a slice; the map is closed when it is collected
+
 
 class AudioSource():
     """Class that defines the interface for audio sources."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         pass
 
+    def read_chunks(self, path: Optional[str] = None, chunk_size: int = CHUNK_SIZE) -> Iterator[memoryview]:
+        """
+        Streams 16-bit stereo PCM audio in chunks.
+
+        File based sources (MP3, CD, Console, Cassete) read from a memory-mapped
+        WAV or raw PCM file. The source keeps no state: every call returns a new
+        independent stream.
+
+        Args:
+            path (str, optional): WAV or raw PCM file to play.
+            chunk_size (int): Bytes per chunk.
+
+        Returns:
+            Iterator[memoryview]: The chunks of samples.
+
+        Raises:
+            ValueError, OSError: If the file is missing or not valid audio (see read_mapped_chunks).
+        """
+        return read_mapped_chunks(path, chunk_size)
+
 
 class MP3(AudioSource):
     """MP3 audio source."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         return "Sonando MP3"
@@ -29,6 +160,8 @@ class MP3(AudioSource):
 
 class CD(AudioSource):
     """CD audio source."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         return "Sonando CD"
@@ -36,45 +169,132 @@ class CD(AudioSource):
 
 class Console(AudioSource):
     """Console audio source."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         return "Sonando Consola"
 
 class Cassete(AudioSource):
     """Cassette audio source."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         return "Sonando Cassete"
 
 class FM(AudioSource):
     """FM radio source."""
+
+    __slots__ = ()
     
     def play(self) -> str:
         return "Sonando FM"
 
+    def read_chunks(self, path: Optional[str] = None, chunk_size: int = CHUNK_SIZE,
+                    frequency: int = 440) -> Iterator[memoryview]:
+        """
+        Streams a synthetic sine tone forever, as if tuned to a station.
+
+        One second of the tone is rendered once and then sliced in a loop,
+        so no samples are generated while streaming.
+
+        Args:
+            path (str, optional): Ignored, FM has no file.
+            chunk_size (int): Bytes per chunk, at most one second of audio.
+            frequency (int): Tone frequency in Hz.
+
+        Yields:
+            memoryview: The next chunk of samples.
+        """
+        samples = array("h", bytes(SAMPLE_RATE * FRAME_SIZE))
+        for frame in range(SAMPLE_RATE):
+            value = int(12000 * math.sin(2 * math.pi * frequency * frame / SAMPLE_RATE))
+            samples[frame * CHANNELS] = value
+            samples[frame * CHANNELS + 1] = value
+        second = samples.tobytes()
+        view = memoryview(second + second)  # doubled so every slice is contiguous
+        offset = 0
+        while True:
+            yield view[offset:offset + chunk_size]
+            offset = (offset + chunk_size) % len(second)
+
+
+# Shared instances keyed by name. Sources hold no state, so every player can reuse them.
+SOURCES = {
+    "MP3": MP3(),
+    "CD": CD(),
+    "Console": Console(),
+    "Cassete": Cassete(),
+    "FM": FM(),
+}
+
+
+def get_source(source: Union[AudioSource, str]) -> AudioSource:
+    """
+    Resolves a source given as an instance or as the name of a registered one.
+
+    Args:
+        source (AudioSource | str): A source, or a key of SOURCES (e.g. "CD").
+
+    Returns:
+        AudioSource: The source itself, or the shared instance registered under that name.
+
+    Raises:
+        ValueError: If a name is not registered in SOURCES.
+
+    Examples:
+        >>> get_source("CD").play()
+        'Sonando CD'
+    """
+    if isinstance(source, str):
+        try:
+            return SOURCES[source]
+        except KeyError:
+            raise ValueError(f"Unknown source {source!r}. Available: {', '.join(SOURCES)}") from None
+    return source
+
 
 class Player:
     """
     Music player that uses polymorphism to switch between sources
     without using conditional statements.
     """
+
+    __slots__ = ("_current_source",)
     
     def __init__(self):
         """Initializes the player with MP3 as the default source."""
-        self._current_source = MP3()
+        self._current_source = SOURCES["MP3"]
     
     def play(self) -> None:
         """Plays music from the current source."""
         print(self._current_source.play())
     
-    def change_source(self,new_source: AudioSource) -> None:
+    def change_source(self, new_source: Union[AudioSource, str]) -> None:
         """
         Changes the playback source.
         
         Args:
-            new_source (AudioSource): New audio source to use.
+            new_source (AudioSource | str): New audio source to use, or the name of
+                a registered source in SOURCES (e.g. "CD") to reuse its shared instance.
+
+        Raises:
+            ValueError: If a name is not registered in SOURCES.
         """
-        self._current_source = new_source
+        self._current_source = get_source(new_source)
+
+
+def play_many(players: Iterable[Player], stream: TextIO = None) -> None:
+    """
+    Plays every player and writes all the output with a single write call.
+
+    Args:
+        players (Iterable[Player]): Players to play.
+        stream (TextIO, optional): Where to write. Defaults to sys.stdout.
+    """
+    lines = [player._current_source.play() for player in players]
+    (stream or sys.stdout).write("".join(line + "\n" for line in lines))
 
 
 # Usage example
@@ -86,15 +306,22 @@ def main():
     player.play()  # Output: "Sonando MP3"
     
     # Change to CD and play
-    player.change_source(CD())
+    player.change_source("CD")
     player.play()  # Output: "Sonando CD"
     
     # Change to Console and play
-    player.change_source(Console())
+    player.change_source("Console")
     player.play()  # Output: "Sonando Consola"
     
     # Back to MP3
-    player.change_source(MP3())
+    player.change_source("MP3")
     player.play()  # Output: "Sonando MP3"
 
-main()
\ No newline at end of file
+    # Many players at once, written in a single call
+    players = [Player() for _ in range(3)]
+    players[1].change_source("FM")
+    play_many(players)  # Output: "Sonando MP3", "Sonando FM", "Sonando MP3"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,253 @@
+"""
+Asynchronous streaming for the music player.
+
+A producer task pulls chunks from the current AudioSource stream and a consumer
+task hands them to a sink. Both are decoupled by a bounded ring buffer, so
+changing the source only swaps the producer's stream while the chunks already
+buffered keep playing.
+
+- RingBuffer: fixed-size asyncio buffer between producer and consumer
+- Sink, NullSink, FileSink: pluggable outputs for the audio
+- AsyncPlayer: asyncio version of Player
+- benchmark(): sustained throughput and p99 chunk latency with a NullSink
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, BinaryIO, Optional, Union
+
+from utilidades import percentil
+from TP3.reproductor import AudioSource, CHUNK_SIZE, SAMPLE_RATE, FRAME_SIZE, get_source
+
+
+class RingBuffer:
+    """
+    Bounded FIFO buffer backed by a preallocated list of slots.
+
+    put() waits while the buffer is full and get() waits while it is empty,
+    which gives backpressure between producer and consumer.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Args:
+            capacity (int): Maximum number of items held at once.
+        """
+        self._slots = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self._changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return self._size
+
+    async def put(self, item: Any) -> None:
+        """Adds an item, waiting for a free slot if the buffer is full."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._size < len(self._slots))
+            self._slots[(self._head + self._size) % len(self._slots)] = item
+            self._size += 1
+            self._changed.notify_all()
+
+    async def get(self) -> Any:
+        """Removes and returns the oldest item, waiting if the buffer is empty."""
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._size > 0)
+            item = self._slots[self._head]
+            self._slots[self._head] = None
+            self._head = (self._head + 1) % len(self._slots)
+            self._size -= 1
+            self._changed.notify_all()
+            return item
+
+
+class Sink:
+    """Class that defines the interface for audio outputs."""
+
+    def write(self, chunk: memoryview) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class NullSink(Sink):
+    """Discards the audio, only counting bytes. Useful for benchmarks."""
+
+    def __init__(self) -> None:
+        self.bytes_written = 0
+
+    def write(self, chunk: memoryview) -> None:
+        self.bytes_written += len(chunk)
+
+
+class FileSink(Sink):
+    """Writes the raw PCM audio to a binary file."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        """
+        Args:
+            file (BinaryIO): File opened in binary write mode.
+        """
+        self._file = file
+
+    def write(self, chunk: memoryview) -> None:
+        self._file.write(chunk)
+
+    def close(self) -> None:
+        self._file.flush()
+
+
+class AsyncPlayer:
+    """
+    Music player that streams audio from its current source to a sink.
+
+    Attributes:
+        sink (Sink): Where the audio goes.
+        chunks_played (int): Chunks delivered to the sink so far.
+        bytes_played (int): Bytes delivered to the sink so far.
+        latencies (deque[float]): Seconds each of the last latency_window chunks spent
+            between being read and reaching the sink.
+    """
+
+    def __init__(self, sink: Sink, buffer_chunks: int = 32, latency_window: int = 100_000) -> None:
+        """
+        Args:
+            sink (Sink): Where the audio goes.
+            buffer_chunks (int): Capacity of the ring buffer in chunks.
+            latency_window (int): Latencies kept for latency_percentile, so memory stays
+                bounded when playing forever (100_000 chunks is about 35 minutes of audio).
+        """
+        self.sink = sink
+        self.chunks_played = 0
+        self.bytes_played = 0
+        self.latencies = deque(maxlen=latency_window)
+        self._buffer = RingBuffer(buffer_chunks)
+        self._stream = None
+        self._source_changed = asyncio.Event()
+
+    def change_source(self, new_source: Union[AudioSource, str], path: Optional[str] = None,
+                      chunk_size: int = CHUNK_SIZE) -> None:
+        """
+        Changes the playback source without waiting for the buffer to drain.
+
+        Args:
+            new_source (AudioSource | str): New source, or the name of a registered one.
+            path (str, optional): File to stream, for file based sources.
+            chunk_size (int): Bytes per chunk.
+
+        Raises:
+            ValueError: If the name is not registered or the file is not valid audio.
+            OSError: If the file cannot be opened. In both cases the current source keeps playing.
+        """
+        stream = get_source(new_source).read_chunks(path, chunk_size)
+        if self._stream is not None:
+            self._stream.close()
+        self._stream = stream
+        self._source_changed.set()
+
+    async def _produce(self) -> None:
+        while True:
+            chunk = next(self._stream, None) if self._stream is not None else None
+            if chunk is None:
+                # Source finished (or none yet): wait for the next change_source
+                self._source_changed.clear()
+                await self._source_changed.wait()
+                continue
+            await self._buffer.put((chunk, time.perf_counter()))
+
+    async def _consume(self, max_chunks: Optional[int]) -> None:
+        while max_chunks is None or self.chunks_played < max_chunks:
+            chunk, read_at = await self._buffer.get()
+            self.sink.write(chunk)
+            self.latencies.append(time.perf_counter() - read_at)
+            self.chunks_played += 1
+            self.bytes_played += len(chunk)
+
+    async def play(self, max_chunks: Optional[int] = None) -> None:
+        """
+        Streams until max_chunks have reached the sink (forever if None).
+
+        Args:
+            max_chunks (int, optional): Number of chunks to play.
+
+        Raises:
+            Exception: Whatever made the producer or the sink fail.
+        """
+        producer = asyncio.create_task(self._produce())
+        consumer = asyncio.create_task(self._consume(max_chunks))
+        try:
+            done, _ = await asyncio.wait((producer, consumer), return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()  # re-raises the error of a failed task
+        finally:
+            producer.cancel()
+            consumer.cancel()
+            await asyncio.gather(producer, consumer, return_exceptions=True)
+            self.sink.close()
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Returns a chunk latency percentile in seconds, over the last latency_window chunks.
+
+        Args:
+            percentile (float): Between 0 and 100.
+
+        Returns:
+            float: The latency, or 0.0 if nothing was played.
+        """
+        return percentil(self.latencies, percentile)
+
+
+async def benchmark(chunks: int = 50000) -> dict[str, float]:
+    """
+    Plays a raw PCM file through a NullSink, switching to FM halfway, and measures it.
+
+    Args:
+        chunks (int): Total chunks to play.
+
+    Returns:
+        dict[str, float]: Throughput in MB/s, seconds of audio per wall second and
+        p99 chunk latency in milliseconds.
+    """
+    import os
+    import tempfile  # only needed here; keeps importing the module cheap
+
+    with tempfile.NamedTemporaryFile(suffix=".pcm", delete=False) as file:
+        file.write(os.urandom(CHUNK_SIZE * (chunks // 2)))
+        path = file.name
+    try:
+        sink = NullSink()
+        player = AsyncPlayer(sink)
+        player.change_source("MP3", path)
+
+        async def switch_to_fm() -> None:
+            while player.chunks_played < chunks // 2:
+                await asyncio.sleep(0.001)
+            player.change_source("FM")
+
+        start = time.perf_counter()
+        switcher = asyncio.create_task(switch_to_fm())
+        await player.play(chunks)
+        elapsed = time.perf_counter() - start
+        switcher.cancel()
+    finally:
+        os.remove(path)
+    audio_seconds = sink.bytes_written / (SAMPLE_RATE * FRAME_SIZE)
+    return {
+        "throughput_mb_s": sink.bytes_written / elapsed / 1e6,
+        "realtime_factor": audio_seconds / elapsed,
+        "p99_latency_ms": player.latency_percentile(99) * 1000,
+    }
+
+
+def main():
+    results = asyncio.run(benchmark())
+    print(f"Throughput: {results['throughput_mb_s']:.1f} MB/s "
+          f"({results['realtime_factor']:.0f}x real time)")
+    print(f"p99 chunk latency: {results['p99_latency_ms']:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,10 @@ from functools import reduce
 from abc import ABC, abstractmethod
 import json
 import os
-from typing import List #menor a python 3.9
+from typing import Callable, List #menor a python 3.9
+
+from instrumentacion import instrumentar
+from TP4.distances import DEFAULT_CACHE, DEFAULT_WAREHOUSE, DistanceCache
 
 
 class Product:
@@ -162,9 +165,16 @@ class Order:
         products (List[Product]): List of products in the order.
         shipping_method (ShippingMethod): The chosen shipping method.
         distance_km (float): Distance for shipping calculation.
+        destination (str): Registered destination the order ships to, if given.
+        save_listeners (List[Callable]): Functions called as listener(order, order_data)
+            after every save_order_to_file, e.g. to keep statistics up to date.
     """
     
-    def __init__(self, products: List[Product], shipping_method: ShippingMethod, distance_km: float = 0) -> None:
+    save_listeners: List[Callable[['Order', dict], None]] = []
+    
+    def __init__(self, products: List[Product], shipping_method: ShippingMethod, distance_km: float = 0,
+                 destination: str = None, origin: str = DEFAULT_WAREHOUSE,
+                 distance_cache: DistanceCache = None) -> None:
         """
         Initialize an order with products and shipping details.
         
@@ -172,9 +182,22 @@ class Order:
             products (List[Product]): List of products to order.
             shipping_method (ShippingMethod): The shipping method to use.
             distance_km (float, optional): Distance in kilometers. Defaults to 0.
+                Ignored when a destination is given.
+            destination (str, optional): Registered destination (see TP4.distances).
+                The distance from origin is looked up in the distance cache, so
+                repeated orders to the same place never recompute it.
+            origin (str, optional): Warehouse the order ships from. Defaults to DEFAULT_WAREHOUSE.
+            distance_cache (DistanceCache, optional): Cache to use. Defaults to the shared DEFAULT_CACHE.
+        
+        Raises:
+            ValueError: If the origin or destination is not a registered location.
         """
         self.products = products
         self.shipping_method = shipping_method
+        self.destination = destination
+        if destination is not None:
+            cache = distance_cache if distance_cache is not None else DEFAULT_CACHE
+            distance_km = cache.distance(origin, destination)
         self.distance_km = distance_km
     
     def order_price(self) -> float:
@@ -195,6 +218,7 @@ class Order:
         """
         return self.shipping_method.calculate_cost(self.distance_km)
 
+    @instrumentar
     def calculate_total_cost(self) -> float:
         """
         Calculate the total cost including products and shipping.
@@ -229,12 +253,15 @@ class Order:
                 f"Estimated time: {self.delivery_time()}")
     
     @staticmethod
+    @instrumentar
     def save_order_to_file(order: 'Order', filename: str = "orders.json") -> None:
         """
         Save an order to a JSON file.
         
         This method serializes the order data and appends it to a JSON file,
-        creating the file if it doesn't exist.
+        creating the file if it doesn't exist. Then every function in
+        save_listeners is called with the order and the saved data; an
+        exception raised by a listener is logged and the next one still runs.
         
         Args:
             order (Order): The order to save.
@@ -266,6 +293,38 @@ class Order:
         # Save all orders
         with open(filename, 'w', encoding='utf-8') as file:
             json.dump(orders, file, indent=2, ensure_ascii=False)
+        
+        # The order is already saved: a failing listener is logged and does not
+        # stop the others nor make the save look failed
+        for listener in list(Order.save_listeners):
+            try:
+                listener(order, order_data)
+            except Exception:
+                import logging
+                logging.getLogger(__name__).exception("Order save listener %r failed", listener)
+    
+    @staticmethod
+    def add_save_listener(listener: Callable[['Order', dict], None]) -> None:
+        """
+        Register a function to call after each order is saved.
+        
+        Args:
+            listener (Callable): Called as listener(order, order_data), where
+                order_data is the dict written to the file.
+        """
+        if listener not in Order.save_listeners:
+            Order.save_listeners.append(listener)
+    
+    @staticmethod
+    def remove_save_listener(listener: Callable[['Order', dict], None]) -> None:
+        """
+        Stop calling a function registered with add_save_listener.
+        
+        Args:
+            listener (Callable): The function to remove. Unknown functions are ignored.
+        """
+        if listener in Order.save_listeners:
+            Order.save_listeners.remove(listener)
 
 
 
@@ -311,6 +370,11 @@ def main() -> None:
     Order.save_order_to_file(order3)
     print("> Order saved to file\n")
     
+    # Case 3b: Order to a destination, the distance comes from the distance cache
+    print("3b. Order with custom shipping to Rosario:")
+    order_rosario = Order([keyboard], custom, destination="Rosario")
+    print(f"   {order_rosario.distance_km:.1f}km -> Total ${order_rosario.calculate_total_cost():.2f}\n")
+    
     # Case 4: Cost comparison for the same order
     print("4. Shipping method comparison for the same order:")
     test_products = [laptop, mouse]
@@ -367,4 +431,6 @@ def main() -> None:
     Order.save_order_to_file(drone_order)
     print("> New method integrated without modifying existing code")
 
-main()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
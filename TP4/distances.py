@@ -0,0 +1,251 @@
+"""
+Distances between warehouses and destinations for distance-priced shipping.
+
+Places are registered once with their coordinates. Distances are great-circle
+(haversine) distances in km, computed in batches when many are needed and
+kept in an LRU cache keyed by (origin, destination), which can be persisted
+to disk between runs.
+
+- register_location(): add a warehouse or destination
+- haversine_km(), haversine_many(): single and vectorized distances
+- DistanceCache: bounded LRU cache with optional JSON persistence
+"""
+
+import json
+import math
+import os
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from utilidades import cargar_numpy
+
+EARTH_RADIUS_KM = 6371.0088
+DEFAULT_WAREHOUSE = "Warehouse Buenos Aires"
+
+# name -> (latitude, longitude) in degrees
+LOCATIONS: Dict[str, Tuple[float, float]] = {
+    "Warehouse Buenos Aires": (-34.6037, -58.3816),
+    "Warehouse Cordoba": (-31.4201, -64.1888),
+    "La Plata": (-34.9205, -57.9536),
+    "Rosario": (-32.9442, -60.6505),
+    "Mar del Plata": (-38.0055, -57.5426),
+    "Neuquen": (-38.9516, -68.0591),
+    "Salta": (-24.7821, -65.4232),
+}
+
+_caches = weakref.WeakSet()  # every DistanceCache, to drop stale pairs in register_location
+
+
+def register_location(name: str, latitude: float, longitude: float) -> None:
+    """
+    Register a warehouse or destination.
+
+    If the name was already registered with other coordinates, the distances
+    cached for it are dropped from every DistanceCache.
+
+    Args:
+        name (str): Name used to refer to the place.
+        latitude (float): Latitude in degrees.
+        longitude (float): Longitude in degrees.
+    """
+    previous = LOCATIONS.get(name)
+    LOCATIONS[name] = (latitude, longitude)
+    if previous is not None and previous != (latitude, longitude):
+        for cache in list(_caches):
+            cache.invalidate(name)
+
+
+def _coordinates(name: str) -> Tuple[float, float]:
+    try:
+        return LOCATIONS[name]
+    except KeyError:
+        raise ValueError(f"Unknown location: {name}") from None
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance between two points.
+
+    Args:
+        lat1, lon1 (float): First point in degrees.
+        lat2, lon2 (float): Second point in degrees.
+
+    Returns:
+        float: Distance in km.
+
+    Examples:
+        >>> round(haversine_km(-34.6037, -58.3816, -34.9205, -57.9536))
+        53
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    a = (math.sin((phi2 - phi1) / 2) ** 2
+         + math.cos(phi1) * math.cos(phi2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_many(lat1, lon1, lat2, lon2) -> list:
+    """
+    Great-circle distances for whole batches of point pairs.
+
+    Each argument is a sequence (or a single number, broadcast to every pair).
+    With NumPy installed the whole batch is computed with array operations.
+
+    Returns:
+        A NumPy array if NumPy is installed, otherwise a list of floats, in km.
+    """
+    np = cargar_numpy()
+    if np is not None:
+        phi1, phi2 = np.radians(lat1), np.radians(lat2)
+        a = (np.sin((phi2 - phi1) / 2) ** 2
+             + np.cos(phi1) * np.cos(phi2) * np.sin(np.radians(np.subtract(lon2, lon1)) / 2) ** 2)
+        return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+    columns = [value if isinstance(value, (list, tuple)) else None for value in (lat1, lon1, lat2, lon2)]
+    size = max(len(column) for column in columns if column is not None)
+    rows = zip(*[column if column is not None else [value] * size
+                 for column, value in zip(columns, (lat1, lon1, lat2, lon2))])
+    return [haversine_km(*row) for row in rows]
+
+
+class DistanceCache:
+    """
+    LRU cache of distances between named locations.
+
+    Attributes:
+        maxsize (int): Maximum number of (origin, destination) pairs kept.
+        path (str): JSON file the cache is loaded from and saved to, if any.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that had to compute the distance.
+    """
+
+    def __init__(self, maxsize: int = 10_000, path: Optional[str] = None) -> None:
+        """
+        Args:
+            maxsize (int): Maximum number of pairs kept.
+            path (str, optional): JSON file to load now and to write in save().
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._distances = OrderedDict()
+        _caches.add(self)
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+            # pairs computed with coordinates that no longer match LOCATIONS are stale
+            saved = {name: tuple(coordinates) for name, coordinates in data["locations"].items()}
+            for origin, destination, km in data["distances"][-maxsize:]:
+                if all(saved.get(name) == LOCATIONS.get(name) for name in (origin, destination)):
+                    self._distances[(origin, destination)] = km
+
+    def __len__(self) -> int:
+        return len(self._distances)
+
+    def distance(self, origin: str, destination: str) -> float:
+        """
+        Distance between two registered locations, computed at most once per pair.
+
+        Args:
+            origin (str): Warehouse name.
+            destination (str): Destination name.
+
+        Returns:
+            float: Distance in km.
+
+        Raises:
+            ValueError: If a location is not registered.
+        """
+        key = (origin, destination)
+        km = self._distances.get(key)
+        if km is not None:
+            self.hits += 1
+            self._distances.move_to_end(key)
+            return km
+        self.misses += 1
+        km = haversine_km(*_coordinates(origin), *_coordinates(destination))
+        self._store(key, km)
+        return km
+
+    def distances(self, origin: str, destinations: Sequence[str]) -> List[float]:
+        """
+        Distances from one warehouse to many destinations.
+
+        Only the pairs missing from the cache are computed, all in one vectorized call.
+
+        Args:
+            origin (str): Warehouse name.
+            destinations (Sequence[str]): Destination names.
+
+        Returns:
+            List[float]: Distance in km for each destination.
+
+        Examples:
+            >>> cache = DistanceCache(maxsize=2)
+            >>> round(cache.distance(DEFAULT_WAREHOUSE, "Rosario"))
+            279
+            >>> [round(km) for km in cache.distances(DEFAULT_WAREHOUSE, ["Rosario", "Salta", "Neuquen"])]
+            [279, 1286, 987]
+            >>> len(cache), cache.hits, cache.misses
+            (2, 1, 3)
+        """
+        # hits are read (and refreshed) before storing anything: storing the
+        # missing pairs may evict them when the batch is bigger than the cache
+        known = {}
+        for destination in dict.fromkeys(destinations):
+            key = (origin, destination)
+            km = self._distances.get(key)
+            if km is not None:
+                self._distances.move_to_end(key)
+                known[destination] = km
+        missing = [destination for destination in dict.fromkeys(destinations) if destination not in known]
+        if missing:
+            lat, lon = _coordinates(origin)
+            coordinates = [_coordinates(d) for d in missing]
+            kms = haversine_many(lat, lon, [c[0] for c in coordinates], [c[1] for c in coordinates])
+            for destination, km in zip(missing, kms):
+                known[destination] = float(km)
+                self._store((origin, destination), float(km))
+            self.misses += len(missing)
+        self.hits += len(destinations) - len(missing)
+        return [known[destination] for destination in destinations]
+
+    def invalidate(self, name: str) -> None:
+        """
+        Drop every cached distance from or to a location.
+
+        Args:
+            name (str): Location name.
+        """
+        for key in [key for key in self._distances if name in key]:
+            del self._distances[key]
+
+    def _store(self, key: Tuple[str, str], km: float) -> None:
+        self._distances[key] = km
+        if len(self._distances) > self.maxsize:
+            self._distances.popitem(last=False)
+
+    def save(self) -> None:
+        """
+        Write the cache to its JSON file (atomically), oldest pairs first.
+
+        The coordinates of every location are saved too, so pairs for places
+        registered again with other coordinates are not loaded back.
+
+        Raises:
+            ValueError: If the cache was created without a path.
+        """
+        if self.path is None:
+            raise ValueError("This cache has no path to save to")
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            names = {name for key in self._distances for name in key}
+            json.dump({
+                "locations": {name: LOCATIONS[name] for name in names if name in LOCATIONS},
+                "distances": [[origin, destination, km] for (origin, destination), km in self._distances.items()],
+            }, file)
+        os.replace(temporary, self.path)
+
+
+# Shared cache used by Order when no other cache is given
+DEFAULT_CACHE = DistanceCache()
@@ -1,3 +1,30 @@
+from array import array
+from enum import IntEnum
+
+from utilidades import cargar_numpy
+
+LIFT_LABELS = ("With one hand", "With both hands", "Cannot lift it")
+
+
+class LiftResult(IntEnum):
+    """
+    Compact outcome of a lift classification, stored as int8 in batch results.
+    """
+    ONE_HAND = 0
+    BOTH_HANDS = 1
+    CANNOT_LIFT = 2
+
+    @property
+    def label(self) -> str:
+        """
+        Get the description used by Person.can_lift.
+
+        Returns:
+            str: "With one hand", "With both hands" or "Cannot lift it".
+        """
+        return LIFT_LABELS[self]
+
+
 class Hand():
     """
     Represents a hand with a maximum weight capacity.
@@ -5,6 +32,8 @@ class Hand():
     Attributes:
         max_weight (float): Maximum weight the hand can hold in kg.
     """
+
+    __slots__ = ("max_weight",)
     
     def __init__(self, max_weight: float) -> None:
         """
@@ -36,6 +65,8 @@ class Person:
         right_hand (Hand): The person's right hand.
         total_strength (float): Combined maximum weight capacity of both hands.
     """
+
+    __slots__ = ("left_hand", "right_hand", "total_strength")
     
     def __init__(self, left_hand: Hand, right_hand: Hand) -> None:
         """
@@ -68,7 +99,70 @@ class Person:
             return "With both hands"
         else:
             return "Cannot lift it"
+
+    def can_lift_many(self, item_weights):
+        """
+        Classify many objects at once for this person.
+        
+        Args:
+            item_weights: Weights in kg (NumPy array, array('d') or any sequence).
+            
+        Returns:
+            NumPy int8 array or array('b') of LiftResult values.
+        """
+        return classify_lifts(item_weights, self.left_hand.max_weight, self.right_hand.max_weight)
+
+
+def classify_lifts(item_weights, left_capacity, right_capacity):
+    """
+    Classify many (person, object) pairs with vectorized comparisons.
+    
+    Capacities can be single numbers (one person, many objects) or sequences
+    of the same length as item_weights (one person per object). The outcome
+    is CANNOT_LIFT minus one for fitting in both hands and minus one more for
+    fitting in the strongest hand, so no branching is needed per pair.
+    
+    Args:
+        item_weights: Weights in kg.
+        left_capacity: Left hand capacity in kg, scalar or per pair.
+        right_capacity: Right hand capacity in kg, scalar or per pair.
+        
+    Returns:
+        A NumPy int8 array if NumPy is installed, otherwise an array('b'),
+        with one LiftResult value per pair. Use lift_labels() to get the strings.
+        
+    Examples:
+        >>> classify_lifts([5, 12, 20, 30], 10, 15).tolist()
+        [0, 0, 1, 2]
+    """
+    np = cargar_numpy()  # batches fall back to array('b') without NumPy
+    if np is not None:
+        weights = np.asarray(item_weights, dtype=float)
+        left = np.asarray(left_capacity, dtype=float)
+        right = np.asarray(right_capacity, dtype=float)
+        one_hand = weights <= np.maximum(left, right)
+        both_hands = weights <= left + right
+        return (LiftResult.CANNOT_LIFT - one_hand.astype(np.int8) - both_hands.astype(np.int8)).astype(np.int8)
+    if isinstance(left_capacity, (int, float)) and isinstance(right_capacity, (int, float)):
+        strongest = max(left_capacity, right_capacity)
+        total = left_capacity + right_capacity
+        return array('b', [LiftResult.CANNOT_LIFT - (w <= strongest) - (w <= total) for w in item_weights])
+    return array('b', [LiftResult.CANNOT_LIFT - (w <= max(l, r)) - (w <= l + r)
+                       for w, l, r in zip(item_weights, left_capacity, right_capacity)])
+
+
+def lift_labels(results) -> list[str]:
+    """
+    Map batch results back to the strings returned by Person.can_lift.
     
+    Args:
+        results: Output of classify_lifts or Person.can_lift_many.
+        
+    Returns:
+        list[str]: One label per result.
+    """
+    return [LIFT_LABELS[result] for result in results]
+
 # Test cases
 def main():
     # Create hands with different capacities
@@ -88,4 +182,8 @@ def main():
         result = person.can_lift(weight)
         print(f"Object of {weight}kg: {result}")
 
-main()
\ No newline at end of file
+    # Same objects classified in one batch
+    print(lift_labels(person.can_lift_many(objects)))
+
+if __name__ == "__main__":
+    main()
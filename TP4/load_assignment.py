@@ -0,0 +1,205 @@
+"""
+Assignment of many items to a crew of people, minimizing the number of trips.
+
+A trip is a round in which every person of the crew carries at most one load.
+In a trip each hand can carry several items as long as their total weight fits
+its capacity, and an item too heavy for one hand can be carried with both hands
+if the person's remaining strength allows it (that uses up both hands).
+
+- assign_loads(): greedy first-fit-decreasing, or exact branch and bound
+- benchmark(): greedy run over 10^5 items and 10^3 people
+"""
+
+import random
+import time
+from bisect import bisect_left, insort
+from typing import List
+
+from TP4.fuerza_manos import Hand, Person
+
+LEFT = "left"
+RIGHT = "right"
+BOTH = "both"
+MAX_EXACT_ITEMS = 16
+
+
+class _Trip:
+    """
+    Remaining capacity of every hand during one trip.
+
+    Free hands are kept in a list sorted by remaining capacity and people in a
+    list sorted by remaining strength, so the best fitting hand or person is
+    found with a binary search instead of scanning the whole crew.
+    """
+
+    def __init__(self, people: List[Person]) -> None:
+        self.remaining = [[p.left_hand.max_weight, p.right_hand.max_weight] for p in people]
+        self.hands = sorted((rem, index, side)
+                            for index, pair in enumerate(self.remaining)
+                            for side, rem in enumerate(pair))
+        self.strength = sorted((sum(pair), index) for index, pair in enumerate(self.remaining))
+        self.loads = []  # (item_index, person_index, hand)
+
+    def place(self, item_index: int, weight: float) -> bool:
+        """
+        Put the item in the hand with the least remaining capacity that fits it,
+        or in the weakest person that can carry it with both hands.
+
+        Returns:
+            bool: True if the item was placed in this trip.
+        """
+        if self.hands and self.hands[-1][0] >= weight:
+            rem, index, side = self.hands.pop(bisect_left(self.hands, (weight, -1, -1)))
+            self.strength.pop(bisect_left(self.strength, (sum(self.remaining[index]), index)))
+            self.remaining[index][side] = rem - weight
+            insort(self.hands, (rem - weight, index, side))
+            insort(self.strength, (sum(self.remaining[index]), index))
+            self.loads.append((item_index, index, (LEFT, RIGHT)[side]))
+            return True
+        if self.strength and self.strength[-1][0] >= weight:
+            total, index = self.strength.pop(bisect_left(self.strength, (weight, -1)))
+            for side in (0, 1):
+                self.hands.pop(bisect_left(self.hands, (self.remaining[index][side], index, side)))
+                self.remaining[index][side] = 0
+            self.loads.append((item_index, index, BOTH))
+            return True
+        return False
+
+
+def _greedy(weights: List[float], people: List[Person]) -> List[List[tuple]]:
+    order = sorted(range(len(weights)), key=weights.__getitem__, reverse=True)
+    trips = []
+    for item_index in order:
+        weight = weights[item_index]
+        if not any(trip.place(item_index, weight) for trip in trips):
+            trip = _Trip(people)
+            trip.place(item_index, weight)
+            trips.append(trip)
+    return [trip.loads for trip in trips]
+
+
+def _exact(weights: List[float], people: List[Person], upper_bound: List[List[tuple]]) -> List[List[tuple]]:
+    """
+    Branch and bound over the number of trips, trying k trips from a lower bound
+    up to one less than the greedy solution.
+    """
+    order = sorted(range(len(weights)), key=weights.__getitem__, reverse=True)
+    crew_strength = sum(p.total_strength for p in people)
+    lower_bound = max(1, -(-sum(weights) // crew_strength))
+
+    def search(position: int, remaining: list, loads: list, trips: int, free_weight: float) -> bool:
+        if position == len(order):
+            return True
+        item_index = order[position]
+        weight = weights[item_index]
+        if sum(weights[i] for i in order[position:]) > free_weight:
+            return False
+        tried = set()
+        for trip in range(trips):
+            # Only the first still empty trip is tried: empty trips are interchangeable
+            empty = all(rem == [p.left_hand.max_weight, p.right_hand.max_weight]
+                        for rem, p in zip(remaining[trip], people))
+            for index, pair in enumerate(remaining[trip]):
+                for side, hand in ((0, LEFT), (1, RIGHT), (None, BOTH)):
+                    capacity = sum(pair) if side is None else pair[side]
+                    key = (trip if not empty else "empty", tuple(pair), side)
+                    if capacity < weight or key in tried:
+                        continue
+                    tried.add(key)
+                    previous = list(pair)
+                    if side is None:
+                        pair[0] = pair[1] = 0
+                    else:
+                        pair[side] -= weight
+                    loads[trip].append((item_index, index, hand))
+                    lost = sum(previous) - sum(pair) - weight  # capacity wasted by a two-hand lift
+                    if search(position + 1, remaining, loads, trips, free_weight - weight - lost):
+                        return True
+                    loads[trip].pop()
+                    pair[:] = previous
+            if empty:
+                break
+        return False
+
+    for trips in range(int(lower_bound), len(upper_bound)):
+        remaining = [[[p.left_hand.max_weight, p.right_hand.max_weight] for p in people]
+                     for _ in range(trips)]
+        loads = [[] for _ in range(trips)]
+        if search(0, remaining, loads, trips, crew_strength * trips):
+            return loads
+    return upper_bound
+
+
+def assign_loads(weights: List[float], people: List[Person], exact: bool = False) -> List[List[tuple]]:
+    """
+    Assign every item to a person and a hand so that the fewest trips are needed.
+
+    Args:
+        weights (List[float]): Weight of each item in kg.
+        people (List[Person]): The crew.
+        exact (bool, optional): Use branch and bound to get the optimal number of
+            trips. Only for small instances (up to MAX_EXACT_ITEMS items).
+            Defaults to False (greedy first-fit-decreasing).
+
+    Returns:
+        List[List[tuple]]: One list per trip with (item_index, person_index, hand)
+        tuples, where hand is "left", "right" or "both".
+
+    Raises:
+        ValueError: If an item is too heavy for everyone, there is no crew,
+            or exact mode is asked for too many items.
+
+    Examples:
+        >>> crew = [Person(Hand(10), Hand(15))]
+        >>> assign_loads([5, 12, 20], crew)
+        [[(2, 0, 'both')], [(1, 0, 'right'), (0, 0, 'left')]]
+    """
+    if not people:
+        raise ValueError("There must be at least one person in the crew")
+    strongest = max(p.total_strength for p in people)
+    too_heavy = [w for w in weights if w > strongest]
+    if too_heavy:
+        raise ValueError(f"Nobody can lift objects of {max(too_heavy)}kg")
+    if exact and len(weights) > MAX_EXACT_ITEMS:
+        raise ValueError(f"Exact mode supports up to {MAX_EXACT_ITEMS} items")
+    trips = _greedy(weights, people)
+    if exact:
+        trips = _exact(weights, people, trips)
+    return trips
+
+
+def benchmark(items: int = 100_000, people: int = 1_000, seed: int = 0) -> dict:
+    """
+    Time the greedy assignment on a random instance.
+
+    Args:
+        items (int): Number of items.
+        people (int): Number of people in the crew.
+        seed (int): Random seed.
+
+    Returns:
+        dict: Seconds taken and number of trips.
+    """
+    rng = random.Random(seed)
+    crew = [Person(Hand(rng.uniform(5, 20)), Hand(rng.uniform(5, 20))) for _ in range(people)]
+    weights = [rng.uniform(0.5, 25) for _ in range(items)]
+    start = time.perf_counter()
+    trips = assign_loads(weights, crew)
+    return {"seconds": time.perf_counter() - start, "trips": len(trips)}
+
+
+def main():
+    crew = [Person(Hand(10), Hand(15)), Person(Hand(8), Hand(8))]
+    weights = [5, 12, 20, 3, 7, 14, 9]
+    for mode, exact in (("Greedy", False), ("Exact", True)):
+        trips = assign_loads(weights, crew, exact=exact)
+        print(f"{mode}: {len(trips)} trips")
+        for number, loads in enumerate(trips, start=1):
+            print(f"  Trip {number}: " + ", ".join(f"{weights[i]}kg -> person {p} ({hand})" for i, p, hand in loads))
+
+    results = benchmark()
+    print(f"\n10^5 items across 10^3 people: {results['trips']} trips in {results['seconds']:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+Asynchronous order processing pipeline.
+
+Orders go through four stages, each one with its own workers and connected
+to the next by a bounded asyncio queue:
+
+    validate -> price -> quote shipping -> persist
+
+When the persistence stage falls behind, the queues fill up and submit()
+waits, so producers are slowed down instead of piling up orders in memory.
+
+- OrderPipeline: the pipeline, with per-stage latency metrics
+- FakeStore: in-memory store with a configurable latency, for load tests
+- JsonFileStore: persists with Order.save_order_to_file in a worker thread
+- load_test(): sustained orders/second and p99 latency against a FakeStore
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+from instrumentacion import medir_bloque
+from utilidades import percentil
+from TP4.compra_envios import (CustomShipping, ExpressShipping, Order, Product,
+                               StandardShipping)
+
+STAGES = ("validate", "price", "quote", "persist")
+
+
+class FakeStore:
+    """
+    In-memory order store that takes a fixed time per save, like a remote database.
+
+    Attributes:
+        records (list[dict]): Saved orders.
+    """
+
+    def __init__(self, latency: float = 0.001) -> None:
+        """
+        Args:
+            latency (float): Seconds each save takes.
+        """
+        self.latency = latency
+        self.records = []
+
+    async def save(self, order: Order, record: dict) -> None:
+        await asyncio.sleep(self.latency)
+        self.records.append(record)
+
+
+class JsonFileStore:
+    """
+    Store that appends to a JSON file through Order.save_order_to_file.
+
+    The file is rewritten on every save, so saves are serialized with a lock
+    and run in a worker thread to keep the event loop free.
+    """
+
+    def __init__(self, filename: str = "orders.json") -> None:
+        """
+        Args:
+            filename (str): JSON file to append to.
+        """
+        self.filename = filename
+        self._lock = asyncio.Lock()
+
+    async def save(self, order: Order, record: dict) -> None:
+        async with self._lock:
+            await asyncio.to_thread(Order.save_order_to_file, order, self.filename)
+
+
+class OrderPipeline:
+    """
+    Processes orders concurrently through validate, price, quote and persist stages.
+
+    Attributes:
+        completed (int): Orders persisted so far.
+        rejected (list[tuple[Order, str]]): Orders that failed validation and why.
+        failed (list[tuple[Order, str, Exception]]): Orders whose stage raised, with
+            the stage and the exception. The worker keeps processing the next orders.
+        stage_latencies (dict[str, list[float]]): Seconds each stage took per order.
+        latencies (list[float]): Seconds from submit() to persisted, per order.
+    """
+
+    def __init__(self, store, concurrency: Optional[Dict[str, int]] = None, queue_size: int = 100) -> None:
+        """
+        Args:
+            store: Object with an async save(order, record) method.
+            concurrency (dict[str, int], optional): Workers per stage. Stages not
+                listed get one worker.
+            queue_size (int): Capacity of the queue in front of each stage.
+
+        Raises:
+            ValueError: If concurrency names a stage not in STAGES or asks for fewer than one worker.
+        """
+        for stage, workers in (concurrency or {}).items():
+            if stage not in STAGES:
+                raise ValueError(f"Unknown stage {stage!r}. Stages: {', '.join(STAGES)}")
+            if not isinstance(workers, int) or workers < 1:
+                raise ValueError(f"Stage {stage!r} needs at least one worker, got {workers!r}")
+        self.store = store
+        self.concurrency = {stage: 1 for stage in STAGES}
+        self.concurrency.update(concurrency or {})
+        self.completed = 0
+        self.rejected = []
+        self.failed = []
+        self.stage_latencies = {stage: [] for stage in STAGES}
+        self.latencies = []
+        self._queues = {}
+        self._queue_size = queue_size
+        self._workers = []
+        self._handlers = {
+            "validate": self._validate,
+            "price": self._price,
+            "quote": self._quote,
+            "persist": self._persist,
+        }
+
+    async def start(self) -> None:
+        """Creates the queues and starts the workers of every stage."""
+        self._queues = {stage: asyncio.Queue(self._queue_size) for stage in STAGES}
+        for position, stage in enumerate(STAGES):
+            next_queue = self._queues[STAGES[position + 1]] if position + 1 < len(STAGES) else None
+            for _ in range(self.concurrency[stage]):
+                self._workers.append(asyncio.create_task(self._work(stage, next_queue)))
+
+    async def submit(self, order: Order) -> None:
+        """
+        Adds an order to the pipeline, waiting while the first queue is full.
+
+        Args:
+            order (Order): The order to process.
+        """
+        await self._queues["validate"].put({"order": order, "submitted_at": time.perf_counter()})
+
+    async def join(self) -> None:
+        """
+        Waits until every submitted order went through all the stages, then stops the workers.
+
+        Raises:
+            Exception: Whatever made a worker stop, instead of waiting forever
+                for the orders it would never take out of its queue.
+        """
+        async def drain() -> None:
+            for stage in STAGES:
+                await self._queues[stage].join()
+
+        drained = asyncio.create_task(drain())
+        try:
+            while not drained.done():
+                done, _ = await asyncio.wait([drained, *self._workers], return_when=asyncio.FIRST_COMPLETED)
+                for worker in done - {drained}:
+                    if not worker.cancelled() and worker.exception() is not None:
+                        raise worker.exception()
+                    raise RuntimeError("A pipeline worker stopped unexpectedly")
+        finally:
+            drained.cancel()
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(drained, *self._workers, return_exceptions=True)
+            self._workers = []
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Returns how many orders are waiting in front of each stage.
+
+        Returns:
+            dict[str, int]: Queue size per stage.
+        """
+        return {stage: queue.qsize() for stage, queue in self._queues.items()}
+
+    def stage_percentile(self, stage: str, percentile: float) -> float:
+        """
+        Returns a latency percentile for one stage, in seconds.
+
+        Args:
+            stage (str): One of STAGES.
+            percentile (float): Between 0 and 100.
+        """
+        return percentil(self.stage_latencies[stage], percentile)
+
+    def latency_percentile(self, percentile: float) -> float:
+        """
+        Returns an end-to-end latency percentile, in seconds.
+
+        Args:
+            percentile (float): Between 0 and 100.
+        """
+        return percentil(self.latencies, percentile)
+
+    async def _work(self, stage: str, next_queue: Optional[asyncio.Queue]) -> None:
+        queue = self._queues[stage]
+        handler = self._handlers[stage]
+        while True:
+            item = await queue.get()
+            try:
+                start = time.perf_counter()
+                try:
+                    with medir_bloque(f"pipeline.{stage}"):
+                        keep_going = await handler(item)
+                except Exception as error:
+                    self.failed.append((item["order"], stage, error))
+                    continue
+                self.stage_latencies[stage].append(time.perf_counter() - start)
+                if keep_going and next_queue is not None:
+                    await next_queue.put(item)
+            finally:
+                queue.task_done()
+
+    async def _validate(self, item: dict) -> bool:
+        order = item["order"]
+        if not order.products:
+            reason = "Order has no products"
+        elif any(product.price < 0 for product in order.products):
+            reason = "Product prices cannot be negative"
+        elif order.distance_km < 0:
+            reason = "Distance cannot be negative"
+        else:
+            return True
+        self.rejected.append((order, reason))
+        return False
+
+    async def _price(self, item: dict) -> bool:
+        item["products_cost"] = item["order"].order_price()
+        return True
+
+    async def _quote(self, item: dict) -> bool:
+        order = item["order"]
+        item["shipping_cost"] = order.shipping_cost()
+        item["delivery_time"] = order.delivery_time()
+        return True
+
+    async def _persist(self, item: dict) -> bool:
+        order = item["order"]
+        record = {
+            "products": [{"name": prod.name, "price": prod.price} for prod in order.products],
+            "shipping_method": str(order.shipping_method),
+            "distance_km": order.distance_km,
+            "products_cost": item["products_cost"],
+            "shipping_cost": item["shipping_cost"],
+            "total_cost": item["products_cost"] + item["shipping_cost"],
+            "delivery_time": item["delivery_time"],
+        }
+        await self.store.save(order, record)
+        self.completed += 1
+        self.latencies.append(time.perf_counter() - item["submitted_at"])
+        return True
+
+
+async def load_test(orders: int = 20000, store_latency: float = 0.001,
+                    concurrency: Optional[Dict[str, int]] = None) -> dict:
+    """
+    Pushes many orders through the pipeline into a FakeStore and measures it.
+
+    Args:
+        orders (int): Number of orders to submit.
+        store_latency (float): Seconds each save takes in the fake store.
+        concurrency (dict[str, int], optional): Workers per stage.
+            Defaults to 64 persistence workers.
+
+    Returns:
+        dict: Orders per second, p99 end-to-end latency and p99 per stage, in milliseconds.
+    """
+    products = [Product("Gamer Laptop", 2500000), Product("Mouse gamer", 35000),
+                Product("Mechanical Keyboard", 85000)]
+    methods = [StandardShipping(), ExpressShipping(), CustomShipping()]
+    pipeline = OrderPipeline(FakeStore(store_latency), concurrency or {"persist": 64})
+    await pipeline.start()
+    start = time.perf_counter()
+    for number in range(orders):
+        order = Order(products[:number % 3 + 1], methods[number % 3], distance_km=number % 50)
+        await pipeline.submit(order)
+    await pipeline.join()
+    elapsed = time.perf_counter() - start
+    return {
+        "orders_per_second": pipeline.completed / elapsed,
+        "p99_latency_ms": pipeline.latency_percentile(99) * 1000,
+        "p99_stage_ms": {stage: pipeline.stage_percentile(stage, 99) * 1000 for stage in STAGES},
+    }
+
+
+def main() -> None:
+    results = asyncio.run(load_test())
+    print(f"Sustained throughput: {results['orders_per_second']:.0f} orders/s")
+    print(f"p99 end-to-end latency: {results['p99_latency_ms']:.1f} ms")
+    for stage, milliseconds in results["p99_stage_ms"].items():
+        print(f"  p99 {stage}: {milliseconds:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
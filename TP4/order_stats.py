@@ -0,0 +1,387 @@
+"""
+Incremental statistics over the order history.
+
+Instead of reloading orders.json and running stats() from TP2/punto8.py over
+every order, OrderStats is fed one order at a time (as a listener of
+Order.save_order_to_file) and keeps:
+
+- RunningStats: count, mean, standard deviation, min and max (Welford)
+- QuantileSketch: approximate median and percentiles with bounded relative error
+- frequency counts per shipping method
+
+for total_cost and shipping_cost. The aggregates are checkpointed to a JSON
+file that already contains the summary, so a dashboard reads the current
+statistics with read_summary() without touching the history.
+"""
+
+import json
+import math
+import os
+import threading
+from collections import Counter
+from typing import Optional
+
+METRICS = ("total_cost", "shipping_cost")
+SUMMARY_PERCENTILES = (50, 90, 99)
+
+
+class RunningStats:
+    """
+    Count, mean, variance, min and max updated one value at a time.
+
+    Attributes:
+        count (int): Values added.
+        mean (float): Mean of the values.
+        minimum (float): Smallest value, or None if empty.
+        maximum (float): Largest value, or None if empty.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value: float) -> None:
+        """
+        Add a value (Welford's algorithm, numerically stable).
+
+        Args:
+            value (float): The new value.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+
+    @property
+    def stdev(self) -> float:
+        """Sample standard deviation (0.0 with fewer than two values)."""
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def to_dict(self) -> dict:
+        return {"count": self.count, "mean": self.mean, "m2": self._m2,
+                "minimum": self.minimum, "maximum": self.maximum}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningStats":
+        running = cls()
+        running.count = data["count"]
+        running.mean = data["mean"]
+        running._m2 = data["m2"]
+        running.minimum = data["minimum"]
+        running.maximum = data["maximum"]
+        return running
+
+
+class QuantileSketch:
+    """
+    Streaming quantiles with logarithmic buckets.
+
+    Each positive value goes to the bucket ceil(log(value) / log(gamma)), so any
+    quantile is answered within relative_accuracy of a value that was added,
+    using a few hundred counters no matter how many values there are.
+    Values <= 0 are counted together as zero.
+
+    Attributes:
+        relative_accuracy (float): Maximum relative error of a quantile.
+        count (int): Values added.
+
+    Examples:
+        >>> sketch = QuantileSketch()
+        >>> for value in range(1, 1001):
+        ...     sketch.add(value)
+        >>> abs(sketch.quantile(0.5) - 500) <= 500 * 0.01
+        True
+    """
+
+    __slots__ = ("relative_accuracy", "_log_gamma", "_buckets", "zero_count", "count", "minimum", "maximum")
+
+    def __init__(self, relative_accuracy: float = 0.01) -> None:
+        """
+        Args:
+            relative_accuracy (float): Between 0 and 1, exclusive.
+
+        Raises:
+            ValueError: If relative_accuracy is out of range.
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self._log_gamma = math.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self._buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value: float) -> None:
+        """
+        Add a value.
+
+        Args:
+            value (float): The new value.
+        """
+        self.count += 1
+        self.minimum = value if self.minimum is None else min(self.minimum, value)
+        self.maximum = value if self.maximum is None else max(self.maximum, value)
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Approximate quantile of the values added so far.
+
+        Args:
+            q (float): Between 0 and 1 (0.5 is the median).
+
+        Returns:
+            float: The estimate, or None if no values were added.
+
+        Raises:
+            ValueError: If q is out of range.
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("q must be between 0 and 1")
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if seen > rank:
+            return min(0.0, self.maximum)
+        gamma = math.exp(self._log_gamma)
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                # midpoint (in relative terms) of the bucket (gamma^(i-1), gamma^i]
+                estimate = 2 * gamma ** index / (gamma + 1)
+                return min(max(estimate, self.minimum), self.maximum)
+        return self.maximum
+
+    def to_dict(self) -> dict:
+        return {"relative_accuracy": self.relative_accuracy, "zero_count": self.zero_count,
+                "count": self.count, "minimum": self.minimum, "maximum": self.maximum,
+                "buckets": {str(index): count for index, count in self._buckets.items()}}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "QuantileSketch":
+        sketch = cls(data["relative_accuracy"])
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.minimum = data["minimum"]
+        sketch.maximum = data["maximum"]
+        sketch._buckets = {int(index): count for index, count in data["buckets"].items()}
+        return sketch
+
+
+class OrderStats:
+    """
+    Aggregates of total_cost and shipping_cost kept up to date order by order.
+
+    Attributes:
+        path (str): Checkpoint file, if any.
+        checkpoint_every (int): Orders between checkpoints.
+        running (dict[str, RunningStats]): Per metric in METRICS.
+        sketches (dict[str, QuantileSketch]): Per metric in METRICS.
+        shipping_methods (Counter): Orders per shipping method.
+    """
+
+    def __init__(self, path: Optional[str] = None, checkpoint_every: int = 1,
+                 relative_accuracy: float = 0.01) -> None:
+        """
+        Args:
+            path (str, optional): JSON checkpoint file. If it exists, the aggregates
+                are restored from it.
+            checkpoint_every (int): Write the checkpoint every this many orders.
+            relative_accuracy (float): Accuracy of the quantile sketches.
+        """
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.running = {metric: RunningStats() for metric in METRICS}
+        self.sketches = {metric: QuantileSketch(relative_accuracy) for metric in METRICS}
+        self.shipping_methods = Counter()
+        self._pending = 0
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as file:
+                self._restore(json.load(file)["state"])
+
+    @property
+    def count(self) -> int:
+        """Orders added so far."""
+        return self.running[METRICS[0]].count
+
+    def add(self, record: dict) -> None:
+        """
+        Add one saved order, checkpointing if it is due.
+
+        Args:
+            record (dict): Order data as written by Order.save_order_to_file.
+        """
+        with self._lock:
+            for metric in METRICS:
+                value = record[metric]
+                self.running[metric].add(value)
+                self.sketches[metric].add(value)
+            self.shipping_methods[record["shipping_method"]] += 1
+            self._pending += 1
+            if self.path is not None and self._pending >= self.checkpoint_every:
+                self._write_checkpoint()
+
+    def on_order_saved(self, order, record: dict) -> None:
+        """Listener for Order.add_save_listener."""
+        self.add(record)
+
+    def attach(self) -> "OrderStats":
+        """
+        Start receiving every order saved with Order.save_order_to_file.
+
+        Returns:
+            OrderStats: self, to allow stats = OrderStats(...).attach().
+        """
+        from TP4.compra_envios import Order
+        Order.add_save_listener(self.on_order_saved)
+        return self
+
+    def detach(self) -> None:
+        """Stop receiving saved orders."""
+        from TP4.compra_envios import Order
+        Order.remove_save_listener(self.on_order_saved)
+
+    def summary(self) -> dict:
+        """
+        Current statistics.
+
+        Returns:
+            dict: 'orders', one dict per metric (count, mean, stdev, min, max,
+                median, p90, p99), 'shipping_methods' and the most common method.
+        """
+        # listeners may be adding orders from worker threads (JsonFileStore)
+        with self._lock:
+            return self._summary()
+
+    def _summary(self) -> dict:
+        result = {"orders": self.count}
+        for metric in METRICS:
+            running = self.running[metric]
+            sketch = self.sketches[metric]
+            result[metric] = {"count": running.count, "mean": running.mean, "stdev": running.stdev,
+                              "min": running.minimum, "max": running.maximum}
+            for percentile in SUMMARY_PERCENTILES:
+                key = "median" if percentile == 50 else f"p{percentile}"
+                result[metric][key] = sketch.quantile(percentile / 100)
+        result["shipping_methods"] = dict(self.shipping_methods)
+        most_common = self.shipping_methods.most_common(1)
+        result["most_common_shipping_method"] = most_common[0][0] if most_common else None
+        return result
+
+    def checkpoint(self) -> None:
+        """
+        Write the summary and the aggregates to the checkpoint file (atomically).
+
+        Raises:
+            ValueError: If there is no checkpoint path.
+        """
+        if self.path is None:
+            raise ValueError("These stats have no checkpoint path")
+        with self._lock:
+            self._write_checkpoint()
+
+    def _write_checkpoint(self) -> None:
+        state = {
+            "running": {metric: running.to_dict() for metric, running in self.running.items()},
+            "sketches": {metric: sketch.to_dict() for metric, sketch in self.sketches.items()},
+            "shipping_methods": dict(self.shipping_methods),
+        }
+        temporary = self.path + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"summary": self._summary(), "state": state}, file, ensure_ascii=False)
+        os.replace(temporary, self.path)
+        self._pending = 0
+
+    def _restore(self, state: dict) -> None:
+        self.running = {metric: RunningStats.from_dict(data) for metric, data in state["running"].items()}
+        self.sketches = {metric: QuantileSketch.from_dict(data) for metric, data in state["sketches"].items()}
+        self.shipping_methods = Counter(state["shipping_methods"])
+
+    @classmethod
+    def rebuild(cls, orders_file: str = "orders.json", path: Optional[str] = None, **kwargs) -> "OrderStats":
+        """
+        Build the aggregates from an existing history, once, e.g. to start using OrderStats.
+
+        Args:
+            orders_file (str): JSON file written by Order.save_order_to_file.
+            path (str, optional): Checkpoint file to write. An existing one is replaced,
+                but only if the whole history could be read.
+            **kwargs: Other OrderStats arguments.
+
+        Returns:
+            OrderStats: The aggregates of every order in the file.
+        """
+        # the old checkpoint is only replaced (atomically) once the history was read
+        stats = cls(None, **kwargs)
+        with open(orders_file, "r", encoding="utf-8") as file:
+            for record in json.load(file):
+                stats.add(record)
+        stats.path = path
+        if path is not None:
+            stats.checkpoint()
+        return stats
+
+
+def read_summary(path: str) -> dict:
+    """
+    Read the statistics from a checkpoint file without rescanning the history.
+
+    Args:
+        path (str): Checkpoint file written by OrderStats.
+
+    Returns:
+        dict: Same as OrderStats.summary() at the last checkpoint.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        return json.load(file)["summary"]
+
+
+def main() -> None:
+    import tempfile
+    from TP2.punto8 import stats as full_stats
+    from TP4.compra_envios import CustomShipping, ExpressShipping, Order, Product, StandardShipping
+
+    products = [Product("Gamer Laptop", 2500000), Product("Mouse gamer", 35000),
+                Product("Mechanical Keyboard", 85000)]
+    methods = [StandardShipping(), ExpressShipping(), CustomShipping()]
+    with tempfile.TemporaryDirectory() as directory:
+        orders_file = os.path.join(directory, "orders.json")
+        checkpoint_file = os.path.join(directory, "order_stats.json")
+        order_stats = OrderStats(checkpoint_file).attach()
+        try:
+            for number in range(200):
+                order = Order(products[:number % 3 + 1], methods[number % 3], distance_km=number % 50)
+                Order.save_order_to_file(order, orders_file)
+        finally:
+            order_stats.detach()
+
+        summary = read_summary(checkpoint_file)
+        print(f"Orders: {summary['orders']}")
+        for metric in METRICS:
+            values = summary[metric]
+            print(f"{metric}: mean {values['mean']:.2f}, median ~{values['median']:.2f}, "
+                  f"p90 ~{values['p90']:.2f}, p99 ~{values['p99']:.2f}")
+        print(f"Shipping methods: {summary['shipping_methods']}")
+
+        with open(orders_file, "r", encoding="utf-8") as file:
+            totals = [record["total_cost"] for record in json.load(file)]
+        print(f"Full rescan with stats(): {full_stats(totals)}")
+
+
+if __name__ == "__main__":
+    main()
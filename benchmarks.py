@@ -0,0 +1,222 @@
+"""
+Benchmarks de los caminos calientes del repositorio, con control de regresiones.
+
+Uso:
+    python benchmarks.py correr [--salida resultados.json] [--tamanio-maximo 1000000] [--filtro primos]
+    python benchmarks.py comparar resultados.json [--base benchmarks_base.json] [--umbral 0.10]
+
+"correr" mide cada función con entradas de 10^3 a 10^7 elementos (hasta
+--tamanio-maximo y el tope de cada benchmark) y guarda en JSON el tiempo,
+el pico de memoria (tracemalloc) y los elementos procesados por segundo.
+"comparar" marca las mediciones que se volvieron más lentas que la base por
+encima del umbral y termina con código 1 si hay alguna.
+
+Todo corre sin red y solo con la biblioteca estándar.
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+TAMANIOS = [10**3, 10**4, 10**5, 10**6, 10**7]
+# con menos corridas el ruido de una sola supera el umbral de comparar()
+MIN_REPETICIONES = 3
+BASE_POR_DEFECTO = "benchmarks_base.json"
+
+
+def _preparar_primos(n: int):
+    from TP2.punto5 import generar_primos_hasta
+    return lambda: generar_primos_hasta(n)
+
+
+def _preparar_stats(n: int):
+    from TP2.punto8 import stats
+    numeros = [(i * 7919) % 1000 + 0.5 for i in range(n)]
+    return lambda: stats(numeros)
+
+
+def _preparar_inventario(n: int):
+    from TP2.punto6 import actualizar_inventario
+    productos = [f"producto_{i}" for i in range(1000)]
+    vendidos = [productos[i % len(productos)] for i in range(n)]
+    return lambda: actualizar_inventario(dict.fromkeys(productos, n), vendidos)
+
+
+def _preparar_guardar_orden(n: int):
+    """Guarda una orden en un archivo que ya tiene n órdenes.
+
+    Antes de cada corrida se restaura el archivo original, así el historial
+    no crece de una corrida a la siguiente.
+    """
+    import atexit
+    import shutil
+    import tempfile
+    from TP4.compra_envios import CustomShipping, Order, Product
+    orden = Order([Product("Mouse gamer", 35000), Product("Mechanical Keyboard", 85000)],
+                  CustomShipping(), distance_km=12)
+    directorio = tempfile.mkdtemp(prefix="bench_ordenes_")
+    atexit.register(shutil.rmtree, directorio, True)
+    original = os.path.join(directorio, "orders_original.json")
+    archivo = os.path.join(directorio, "orders.json")
+    registro = {"products": [{"name": "Mouse gamer", "price": 35000}], "shipping_method": "Standard",
+                "distance_km": 0, "products_cost": 35000, "shipping_cost": 5000,
+                "total_cost": 40000, "delivery_time": "5-7 business days"}
+    with open(original, "w", encoding="utf-8") as f:
+        json.dump([registro] * n, f)
+    return (lambda: Order.save_order_to_file(orden, archivo),
+            lambda: shutil.copyfile(original, archivo))
+
+
+def _preparar_slicing(n: int):
+    from TP1.punto08 import slicing_function
+    texto = " | ".join(f"Clave{i}: {i if i % 2 else 'valor'}" for i in range(n))
+    return lambda: slicing_function(texto)
+
+
+# nombre -> (preparar(n), tamaño máximo razonable)
+# preparar(n) devuelve la función a medir, o (función, reiniciar) si hay que
+# restaurar algo antes de cada corrida; reiniciar() no se cuenta en el tiempo.
+BENCHMARKS = {
+    "primos": (_preparar_primos, 10**5),  # división por tentativa: O(n * raíz(n))
+    "stats": (_preparar_stats, 10**7),
+    "inventario": (_preparar_inventario, 10**7),
+    "guardar_orden": (_preparar_guardar_orden, 10**5),  # reescribe todo el historial
+    "slicing": (_preparar_slicing, 10**6),
+}
+
+
+def medir(funcion, repeticiones: int, reiniciar=None) -> dict:
+    """Mide una función: mejor tiempo de varias corridas y pico de memoria de una corrida aparte.
+
+    tracemalloc hace más lento el código, por eso la memoria se mide por separado.
+
+    Args:
+        funcion: Función sin argumentos a medir.
+        repeticiones (int): Cantidad de corridas para el tiempo.
+        reiniciar (optional): Función sin argumentos que se llama antes de cada
+            corrida, fuera de la medición.
+
+    Returns:
+        dict: {'segundos': float, 'pico_memoria_bytes': int}
+    """
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        if reiniciar is not None:
+            reiniciar()
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    if reiniciar is not None:
+        reiniciar()
+    tracemalloc.start()
+    try:
+        funcion()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"segundos": mejor, "pico_memoria_bytes": pico}
+
+
+def correr(tamanio_maximo: int, filtro: str = None, repeticiones: int = 3) -> dict:
+    """Corre todos los benchmarks y devuelve los resultados.
+
+    Args:
+        tamanio_maximo (int): Tamaño de entrada más grande a probar.
+        filtro (str, optional): Solo corre los benchmarks cuyo nombre contiene este texto.
+        repeticiones (int): Corridas por medición (se queda con la más rápida).
+            Nunca menos de MIN_REPETICIONES, también en los tamaños grandes.
+
+    Returns:
+        dict: Metadatos de la máquina y un resultado por "nombre/tamaño".
+    """
+    import platform
+    from datetime import datetime
+
+    repeticiones = max(repeticiones, MIN_REPETICIONES)
+    resultados = {}
+    for nombre, (preparar, tope) in BENCHMARKS.items():
+        if filtro and filtro not in nombre:
+            continue
+        for n in TAMANIOS:
+            if n > min(tamanio_maximo, tope):
+                break
+            preparado = preparar(n)
+            funcion, reiniciar = preparado if isinstance(preparado, tuple) else (preparado, None)
+            medicion = medir(funcion, repeticiones, reiniciar)
+            medicion["elementos_por_segundo"] = n / medicion["segundos"] if medicion["segundos"] else 0.0
+            resultados[f"{nombre}/{n}"] = medicion
+            print(f"{nombre + '/' + str(n):<24} {medicion['segundos'] * 1000:10.2f} ms "
+                  f"{medicion['pico_memoria_bytes'] / 2**20:9.2f} MiB "
+                  f"{medicion['elementos_por_segundo']:14.0f} elem/s")
+    return {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "maquina": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def comparar(actual: dict, base: dict, umbral: float) -> list[str]:
+    """Compara dos corridas y lista las regresiones de tiempo o memoria.
+
+    Args:
+        actual (dict): Resultados nuevos.
+        base (dict): Resultados de referencia.
+        umbral (float): Empeoramiento relativo tolerado (0.10 = 10%).
+
+    Returns:
+        list[str]: Una línea por regresión. Vacía si no hay ninguna.
+    """
+    regresiones = []
+    for clave, medicion in sorted(actual["resultados"].items()):
+        referencia = base["resultados"].get(clave)
+        if referencia is None:
+            continue
+        for metrica in ("segundos", "pico_memoria_bytes"):
+            if referencia[metrica] and medicion[metrica] > referencia[metrica] * (1 + umbral):
+                cambio = medicion[metrica] / referencia[metrica] - 1
+                regresiones.append(f"{clave} {metrica}: {referencia[metrica]:.6g} -> "
+                                   f"{medicion[metrica]:.6g} (+{cambio:.0%})")
+    return regresiones
+
+
+def _cargar(ruta: str) -> dict:
+    with open(ruta, "r", encoding="utf-8") as archivo:
+        return json.load(archivo)
+
+
+def main() -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmarks de los caminos calientes")
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+    parser_correr = subcomandos.add_parser("correr", help="mide y guarda los resultados")
+    parser_correr.add_argument("--salida", default="benchmarks_resultados.json")
+    parser_correr.add_argument("--tamanio-maximo", type=int, default=10**6)
+    parser_correr.add_argument("--filtro")
+    parser_correr.add_argument("--repeticiones", type=int, default=3)
+    parser_comparar = subcomandos.add_parser("comparar", help="compara contra una base")
+    parser_comparar.add_argument("resultados")
+    parser_comparar.add_argument("--base", default=BASE_POR_DEFECTO)
+    parser_comparar.add_argument("--umbral", type=float, default=0.10)
+    argumentos = parser.parse_args(sys.argv[1:])
+
+    if argumentos.comando == "correr":
+        resultados = correr(argumentos.tamanio_maximo, argumentos.filtro, argumentos.repeticiones)
+        with open(argumentos.salida, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+        print(f"\nResultados guardados en {argumentos.salida}")
+        return 0
+
+    regresiones = comparar(_cargar(argumentos.resultados), _cargar(argumentos.base), argumentos.umbral)
+    for regresion in regresiones:
+        print(f"REGRESIÓN {regresion}")
+    if not regresiones:
+        print(f"Sin regresiones por encima del {argumentos.umbral:.0%}")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Punto de entrada único para todos los trabajos prácticos.
+
+Uso:
+    python cli.py                       # lista los comandos
+    python cli.py <comando> [args...]   # corre el main() del módulo del comando
+    python cli.py tiempos-importacion   # mide el tiempo de importación en frío de cada módulo
+
+Solo se importa el módulo del comando pedido, así que arrancar un comando no
+paga el costo de importar el resto (ni sus dependencias, como numpy o asyncio).
+"""
+
+import importlib
+import os
+import re
+import subprocess
+import sys
+
+# comando -> (módulo, función de entrada)
+COMANDOS = {
+    "ordenar": ("TP1.punto01", "main"),
+    "conjunto": ("TP1.punto02", "main_cli"),
+    "diferencias": ("TP1.punto03", "main"),
+    "duplicados": ("TP1.punto04", "main"),
+    "factorial": ("TP1.punto05", "main"),
+    "fibonacci": ("TP1.punto06", "main"),
+    "suma": ("TP1.punto07", "main"),
+    "slicing": ("TP1.punto08", "main"),
+    "descuento": ("TP2.punto1", "main"),
+    "temperatura": ("TP2.punto2", "main"),
+    "palindromo": ("TP2.punto3", "main"),
+    "palabras": ("TP2.punto4", "main"),
+    "primos": ("TP2.punto5", "main"),
+    "inventario": ("TP2.punto6", "main"),
+    "caracteres": ("TP2.punto7", "main"),
+    "estadisticas": ("TP2.punto8", "main"),
+    "analisis-texto": ("TP2.analisis_texto", "main"),
+    "conversion": ("TP2.conversion_masiva", "main"),
+    "reproductor": ("TP3.reproductor", "main"),
+    "streaming": ("TP3.streaming", "main"),
+    "mixer": ("TP3.mixer", "main"),
+    "compras": ("TP4.compra_envios", "main"),
+    "fuerza": ("TP4.fuerza_manos", "main"),
+    "cargas": ("TP4.load_assignment", "main"),
+    "pipeline": ("TP4.order_pipeline", "main"),
+    "estadisticas-ordenes": ("TP4.order_stats", "main"),
+    "benchmarks": ("benchmarks", "main"),
+}
+
+# Presupuesto de importación en frío por módulo, en milisegundos.
+PRESUPUESTO_IMPORTACION_MS = 50
+# Cada módulo se mide varias veces y se toma el mínimo, para no fallar por ruido de la máquina.
+REPETICIONES_IMPORTACION = 5
+# módulo -> dependencia opcional sin la cual el módulo no se mide (cualquier otro error falla)
+DEPENDENCIAS_OPCIONALES = {
+    "TP3.mixer": "numpy",
+}
+PRESUPUESTO_ESPECIAL_MS = {
+    "TP3.mixer": 300,  # importa numpy, que es el corazón de ese módulo
+    "TP3.streaming": 150,  # importa asyncio
+    "TP4.order_pipeline": 150,  # importa asyncio
+}
+
+
+def tiempo_importacion_ms(modulo: str) -> float:
+    """Mide cuánto tarda importar un módulo en un intérprete nuevo.
+
+    Usa ``python -X importtime`` y toma el tiempo acumulado del propio módulo,
+    así que no cuenta el arranque del intérprete.
+
+    Args:
+        modulo (str): Nombre completo del módulo (ej: "TP4.compra_envios").
+
+    Returns:
+        float: Milisegundos.
+
+    Raises:
+        ModuleNotFoundError: Si falta un módulo que el importado necesita.
+        RuntimeError: Si el módulo no se pudo importar por otro motivo.
+    """
+    resultado = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+                               capture_output=True, text=True,
+                               cwd=os.path.dirname(os.path.abspath(__file__)))
+    if resultado.returncode != 0:
+        ultima_linea = resultado.stderr.strip().splitlines()[-1]
+        faltante = re.match(r"ModuleNotFoundError: No module named '([^']+)'", ultima_linea)
+        if faltante:
+            raise ModuleNotFoundError(ultima_linea, name=faltante.group(1))
+        raise RuntimeError(ultima_linea)
+    # formato: "import time: self [us] | cumulative | imported package"
+    for linea in reversed(resultado.stderr.splitlines()):
+        coincidencia = re.match(r"import time:\s*\d+\s*\|\s*(\d+)\s*\|\s*(\S+)", linea)
+        if coincidencia and coincidencia.group(2) == modulo:
+            return int(coincidencia.group(1)) / 1000
+    raise RuntimeError(f"No se encontró {modulo} en la salida de -X importtime")
+
+
+def verificar_tiempos_importacion() -> bool:
+    """Mide cada módulo y lo compara con su presupuesto.
+
+    Se queda con la medición más rápida de REPETICIONES_IMPORTACION corridas.
+    Un módulo que no se puede importar cuenta como falla, salvo que lo que
+    falte sea su dependencia opcional (DEPENDENCIAS_OPCIONALES).
+
+    Returns:
+        bool: True si todos los módulos se importan dentro del presupuesto.
+    """
+    todo_ok = True
+    for modulo in sorted({modulo for modulo, _ in COMANDOS.values()}):
+        presupuesto = PRESUPUESTO_ESPECIAL_MS.get(modulo, PRESUPUESTO_IMPORTACION_MS)
+        try:
+            milisegundos = min(tiempo_importacion_ms(modulo) for _ in range(REPETICIONES_IMPORTACION))
+        except ModuleNotFoundError as error:
+            opcional = DEPENDENCIAS_OPCIONALES.get(modulo)
+            if opcional is not None and error.name.split(".")[0] == opcional:
+                print(f"{modulo:<24} no se mide: falta la dependencia opcional {opcional}")
+                continue
+            print(f"{modulo:<24} ERROR al importar: {error}")
+            todo_ok = False
+            continue
+        except RuntimeError as error:
+            print(f"{modulo:<24} ERROR al importar: {error}")
+            todo_ok = False
+            continue
+        estado = "ok" if milisegundos <= presupuesto else "EXCEDIDO"
+        todo_ok = todo_ok and milisegundos <= presupuesto
+        print(f"{modulo:<24} {milisegundos:7.1f} ms  (presupuesto {presupuesto} ms)  {estado}")
+    return todo_ok
+
+
+def mostrar_comandos() -> None:
+    print("Uso: python cli.py <comando> [args...]\n")
+    print("Comandos:")
+    for comando, (modulo, _) in COMANDOS.items():
+        print(f"  {comando:<16} {modulo}")
+    print("  tiempos-importacion  mide el tiempo de importación de cada módulo")
+
+
+def main() -> int:
+    if len(sys.argv) < 2 or sys.argv[1] in ("-h", "--help"):
+        mostrar_comandos()
+        return 0
+    comando = sys.argv[1]
+    if comando == "tiempos-importacion":
+        return 0 if verificar_tiempos_importacion() else 1
+    if comando not in COMANDOS:
+        print(f"Comando desconocido: {comando}\n")
+        mostrar_comandos()
+        return 2
+    nombre_modulo, funcion = COMANDOS[comando]
+    # el módulo ve sus argumentos como si lo hubieran corrido directamente
+    sys.argv = [nombre_modulo] + sys.argv[2:]
+    # los main() que devuelven un código de salida (ej: benchmarks comparar) lo propagan
+    return getattr(importlib.import_module(nombre_modulo), funcion)() or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,267 @@
+"""
+Instrumentación liviana de los caminos calientes.
+
+Cuenta llamadas y arma un histograma de latencias por función, y opcionalmente
+guarda trazas de una muestra de las llamadas. Desactivada cuesta una
+comparación y una lectura del reloj por llamada.
+
+Uso:
+    @instrumentar
+    def funcion(...): ...
+
+    with medir_bloque("guardar_archivo"):
+        ...
+
+    volcar("metricas.prom")                              # formato Prometheus
+    volcar("metricas.json", formato="json")
+    volcar(direccion=("localhost", 9999))                # por socket TCP
+
+Variables de entorno (se releen como mucho una vez por segundo, así que se pueden
+cambiar en tiempo de ejecución, ej: os.environ["TP_MUESTREO"] = "0.1"):
+    TP_INSTRUMENTACION=1   activa la instrumentación; 0 o vacía la desactiva. activar() y
+                           desactivar() mandan hasta que la variable vuelva a cambiar
+    TP_MUESTREO=0.01       fracción de llamadas que dejan una traza
+"""
+
+import functools
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+
+# límites superiores de los buckets del histograma, en segundos
+BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+MAX_TRAZAS = 10_000
+_INTERVALO_RELECTURA = 1.0
+
+
+class _Metrica:
+    """Llamadas y latencias acumuladas de una función."""
+
+    __slots__ = ("llamadas", "suma_segundos", "buckets")
+
+    def __init__(self) -> None:
+        self.llamadas = 0
+        self.suma_segundos = 0.0
+        self.buckets = [0] * len(BUCKETS)
+
+
+class _Estado:
+    def __init__(self) -> None:
+        self.valor_entorno = os.environ.get("TP_INSTRUMENTACION", "")
+        self.activo = self.valor_entorno not in ("", "0")
+        self.metricas = {}
+        self.trazas = deque(maxlen=MAX_TRAZAS)
+        self.lock = threading.Lock()
+        self.cada_n_llamadas = 0  # 0 = sin muestreo; si no, se traza una de cada n llamadas
+        self.contador_muestreo = 0
+        self.proxima_relectura = 0.0
+
+
+_estado = _Estado()
+
+
+def activar() -> None:
+    """Empieza a registrar métricas."""
+    _estado.activo = True
+
+
+def desactivar() -> None:
+    """Deja de registrar métricas (las ya registradas se conservan)."""
+    _estado.activo = False
+
+
+def reiniciar() -> None:
+    """Borra todas las métricas y trazas registradas."""
+    with _estado.lock:
+        _estado.metricas.clear()
+        _estado.trazas.clear()
+
+
+def _releer_entorno(ahora: float) -> None:
+    _estado.proxima_relectura = ahora + _INTERVALO_RELECTURA
+    valor = os.environ.get("TP_INSTRUMENTACION", "")
+    if valor != _estado.valor_entorno:  # solo un cambio de la variable pisa a activar()/desactivar()
+        _estado.valor_entorno = valor
+        _estado.activo = valor not in ("", "0")
+    try:
+        tasa = float(os.environ.get("TP_MUESTREO", "0"))
+    except ValueError:
+        tasa = 0.0
+    _estado.cada_n_llamadas = round(1 / tasa) if tasa > 0 else 0
+
+
+def _registrar(nombre: str, inicio: float, segundos: float) -> None:
+    with _estado.lock:
+        metrica = _estado.metricas.get(nombre)
+        if metrica is None:
+            metrica = _estado.metricas[nombre] = _Metrica()
+        metrica.llamadas += 1
+        metrica.suma_segundos += segundos
+        metrica.buckets[bisect_left(BUCKETS, segundos)] += 1
+        if inicio >= _estado.proxima_relectura:
+            _releer_entorno(inicio)
+        if _estado.cada_n_llamadas:
+            _estado.contador_muestreo += 1
+            if _estado.contador_muestreo >= _estado.cada_n_llamadas:
+                _estado.contador_muestreo = 0
+                _estado.trazas.append({"funcion": nombre, "inicio": time.time() - segundos,
+                                       "duracion": segundos, "hilo": threading.get_ident()})
+
+
+def instrumentar(funcion=None, *, nombre: str = None):
+    """Decorador que registra llamadas y latencia de una función.
+
+    Se puede usar como ``@instrumentar`` o ``@instrumentar(nombre="...")``.
+    Por defecto la métrica se llama ``modulo.funcion``.
+
+    Args:
+        funcion: La función a decorar.
+        nombre (str, optional): Nombre de la métrica.
+
+    Returns:
+        La función envuelta.
+    """
+    if funcion is None:
+        return functools.partial(instrumentar, nombre=nombre)
+    nombre_metrica = nombre or f"{funcion.__module__}.{funcion.__qualname__}"
+
+    @functools.wraps(funcion)
+    def envoltura(*args, **kwargs):
+        if not _estado.activo:
+            ahora = time.perf_counter()
+            if ahora >= _estado.proxima_relectura:
+                _releer_entorno(ahora)
+            if not _estado.activo:
+                return funcion(*args, **kwargs)
+        inicio = time.perf_counter()
+        try:
+            return funcion(*args, **kwargs)
+        finally:
+            _registrar(nombre_metrica, inicio, time.perf_counter() - inicio)
+
+    return envoltura
+
+
+class _BloqueVacio:
+    """Context manager que no hace nada; se comparte entre todas las llamadas con la instrumentación apagada."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *_) -> None:
+        return None
+
+
+class _BloqueMedido:
+    """Context manager que registra la latencia de un bloque."""
+
+    __slots__ = ("nombre", "inicio")
+
+    def __init__(self, nombre: str) -> None:
+        self.nombre = nombre
+
+    def __enter__(self) -> None:
+        self.inicio = time.perf_counter()
+
+    def __exit__(self, *_) -> None:
+        _registrar(self.nombre, self.inicio, time.perf_counter() - self.inicio)
+
+
+_BLOQUE_VACIO = _BloqueVacio()
+
+
+def medir_bloque(nombre: str):
+    """Context manager que registra la latencia de un bloque de código.
+
+    Con la instrumentación apagada devuelve un context manager vacío
+    compartido, así medir un bloque cuesta casi lo mismo que no medirlo.
+
+    Args:
+        nombre (str): Nombre de la métrica.
+    """
+    if not _estado.activo:
+        ahora = time.perf_counter()
+        if ahora >= _estado.proxima_relectura:
+            _releer_entorno(ahora)
+        if not _estado.activo:
+            return _BLOQUE_VACIO
+    return _BloqueMedido(nombre)
+
+
+def exportar_json() -> dict:
+    """Devuelve una foto de las métricas y trazas.
+
+    Returns:
+        dict: {'metricas': {nombre: {...}}, 'trazas': [...]}
+    """
+    with _estado.lock:
+        metricas = {
+            nombre: {
+                "llamadas": metrica.llamadas,
+                "suma_segundos": metrica.suma_segundos,
+                "buckets": {str(limite): cantidad for limite, cantidad in zip(BUCKETS, metrica.buckets)},
+            }
+            for nombre, metrica in _estado.metricas.items()
+        }
+        return {"metricas": metricas, "trazas": list(_estado.trazas)}
+
+
+def exportar_prometheus() -> str:
+    """Devuelve las métricas en el formato de texto de Prometheus.
+
+    Returns:
+        str: Un contador de llamadas y un histograma de latencia por función.
+    """
+    lineas = ["# TYPE tp_llamadas_total counter"]
+    with _estado.lock:
+        metricas = sorted(_estado.metricas.items())
+        for nombre, metrica in metricas:
+            lineas.append(f'tp_llamadas_total{{funcion="{nombre}"}} {metrica.llamadas}')
+        lineas.append("# TYPE tp_latencia_segundos histogram")
+        for nombre, metrica in metricas:
+            acumulado = 0
+            for limite, cantidad in zip(BUCKETS, metrica.buckets):
+                acumulado += cantidad
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                lineas.append(f'tp_latencia_segundos_bucket{{funcion="{nombre}",le="{le}"}} {acumulado}')
+            lineas.append(f'tp_latencia_segundos_sum{{funcion="{nombre}"}} {metrica.suma_segundos}')
+            lineas.append(f'tp_latencia_segundos_count{{funcion="{nombre}"}} {metrica.llamadas}')
+    return "\n".join(lineas) + "\n"
+
+
+def volcar(ruta: str = None, direccion: tuple = None, formato: str = "prometheus") -> None:
+    """Escribe una foto de las métricas en un archivo o la manda por un socket TCP.
+
+    El archivo se escribe en uno temporal y se reemplaza, así quien lo lee
+    nunca ve una foto a medias.
+
+    Args:
+        ruta (str, optional): Archivo de destino.
+        direccion (tuple, optional): (host, puerto) al que conectarse y mandar la foto.
+        formato (str): "prometheus" o "json".
+
+    Raises:
+        ValueError: Si el formato no es válido o no se indicó ningún destino.
+    """
+    if formato == "prometheus":
+        contenido = exportar_prometheus()
+    elif formato == "json":
+        import json
+        contenido = json.dumps(exportar_json(), indent=2)
+    else:
+        raise ValueError("Formato no válido. Use 'prometheus' o 'json'.")
+    if ruta is None and direccion is None:
+        raise ValueError("Hay que indicar una ruta o una dirección")
+    if ruta is not None:
+        temporal = ruta + ".tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(contenido)
+        os.replace(temporal, ruta)
+    if direccion is not None:
+        import socket
+        with socket.create_connection(direccion, timeout=5) as conexion:
+            conexion.sendall(contenido.encode("utf-8"))
@@ -0,0 +1,51 @@
+"""
+Funciones auxiliares compartidas por los trabajos prácticos.
+
+- cargar_numpy(): importa NumPy recién cuando se lo necesita (es opcional)
+- percentil(): percentil de una lista de mediciones
+"""
+
+from typing import Collection
+
+_numpy = None
+
+
+def cargar_numpy():
+    """Importa NumPy la primera vez que se lo pide.
+
+    Así importar un módulo que lo usa de forma opcional sigue siendo barato, y
+    sin NumPy instalado el llamador usa su alternativa en Python puro.
+
+    Returns:
+        El módulo numpy, o None si no está instalado.
+    """
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def percentil(valores: Collection[float], porcentaje: float) -> float:
+    """Devuelve el percentil pedido de una lista de valores (el valor en esa posición, sin interpolar).
+
+    Args:
+        valores (Collection[float]): Mediciones en cualquier orden (lista, deque...).
+        porcentaje (float): Entre 0 y 100.
+
+    Returns:
+        float: El valor, o 0.0 si la lista está vacía.
+
+    Examples:
+        >>> percentil([3, 1, 2, 4], 50)
+        3
+        >>> percentil([], 99)
+        0.0
+    """
+    if not valores:
+        return 0.0
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * porcentaje / 100))]